@@ -7,47 +7,62 @@ This server provides test forms at different difficulty levels:
 
 from __future__ import annotations
 
-import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+import orjson
+from fastapi import FastAPI, Form, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
 app = FastAPI(
     title="Mock Form Server",
     description="Test forms for GUI Agent development",
     version="0.1.0",
+    # orjson is ~3-5x faster than stdlib json and serializes straight to
+    # bytes, which matters once submission lists grow.
+    default_response_class=ORJSONResponse,
 )
 
-# Store submitted data in memory for verification
-submitted_data: dict[str, list[dict[str, Any]]] = {
-    "simple": [],
-    "complex": [],
+# Store submitted data in memory for verification. Bounded so long fuzz
+# runs evict the oldest submissions instead of growing without limit.
+_MAX_SUBMISSIONS = 1000
+
+submitted_data: dict[str, deque[dict[str, Any]]] = {
+    "simple": deque(maxlen=_MAX_SUBMISSIONS),
+    "complex": deque(maxlen=_MAX_SUBMISSIONS),
 }
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Templates are static; read them once at import so request handlers
+# serve from memory with no stat/open/read syscalls on the hot path.
+_TEMPLATE_CACHE: dict[str, str] = {
+    path.stem: path.read_text() for path in TEMPLATES_DIR.glob("*.html")
+}
+
 
 def load_template(name: str) -> str:
-    """Load an HTML template file."""
-    template_path = TEMPLATES_DIR / f"{name}.html"
-    if template_path.exists():
-        return template_path.read_text()
-    raise FileNotFoundError(f"Template {name} not found")
+    """Return a cached HTML template."""
+    try:
+        return _TEMPLATE_CACHE[name]
+    except KeyError:
+        raise FileNotFoundError(f"Template {name} not found") from None
+
+
+# Encoded once at import; the health check is polled constantly by Docker
+# and should cost nothing per request.
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint for Docker."""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
-@app.get("/", response_class=HTMLResponse)
-async def index() -> str:
-    """Landing page with links to all forms."""
-    return """
+_INDEX_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -109,6 +124,12 @@ async def index() -> str:
     """
 
 
+@app.get("/", response_class=HTMLResponse)
+async def index() -> str:
+    """Landing page with links to all forms (precomputed at import)."""
+    return _INDEX_HTML
+
+
 @app.get("/simple", response_class=HTMLResponse)
 async def simple_form() -> str:
     """Simple contact form - MVP0 target."""
@@ -123,7 +144,7 @@ async def submit_simple_form(
     phone: str = Form(default=""),
     subject: str = Form(...),
     message: str = Form(...),
-) -> JSONResponse:
+) -> dict[str, Any]:
     """Handle simple form submission."""
     data = {
         "timestamp": datetime.now().isoformat(),
@@ -135,9 +156,7 @@ async def submit_simple_form(
         "message": message,
     }
     submitted_data["simple"].append(data)
-    return JSONResponse(
-        content={"status": "success", "message": "Form submitted successfully!", "data": data}
-    )
+    return {"status": "success", "message": "Form submitted successfully!", "data": data}
 
 
 @app.get("/complex", response_class=HTMLResponse)
@@ -147,7 +166,7 @@ async def complex_form() -> str:
 
 
 @app.post("/complex/submit")
-async def submit_complex_form(request: Request) -> JSONResponse:
+async def submit_complex_form(request: Request) -> dict[str, Any]:
     """Handle complex form submission."""
     form_data = await request.form()
     data = {
@@ -155,31 +174,63 @@ async def submit_complex_form(request: Request) -> JSONResponse:
         **{key: value for key, value in form_data.items()},
     }
     submitted_data["complex"].append(data)
-    return JSONResponse(
-        content={"status": "success", "message": "Employee onboarding submitted!", "data": data}
-    )
+    return {"status": "success", "message": "Employee onboarding submitted!", "data": data}
 
 
 @app.get("/submissions/{form_type}")
-async def get_submissions(form_type: str) -> JSONResponse:
+async def get_submissions(form_type: str) -> ORJSONResponse:
     """Get all submissions for a form type."""
     if form_type not in submitted_data:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": f"Unknown form type: {form_type}"},
             status_code=404,
         )
-    return JSONResponse(content={"submissions": submitted_data[form_type]})
+    return ORJSONResponse(content={"submissions": list(submitted_data[form_type])})
 
 
 @app.delete("/submissions/{form_type}")
-async def clear_submissions(form_type: str) -> JSONResponse:
+async def clear_submissions(form_type: str) -> dict[str, str]:
     """Clear all submissions for a form type."""
     if form_type in submitted_data:
-        submitted_data[form_type] = []
-    return JSONResponse(content={"status": "cleared"})
+        submitted_data[form_type].clear()
+    return {"status": "cleared"}
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # Default to a single worker: submitted_data lives in process memory,
+    # so with multiple workers a submission could land in one worker while
+    # /submissions reads another. Set MOCK_SERVER_WORKERS=0 for one worker
+    # per core during pure load tests that don't verify submissions.
+    # TODO: back submitted_data with a shared store (Redis/SQLite) so
+    # multi-worker can become the default.
+    workers = int(os.environ.get("MOCK_SERVER_WORKERS", "1"))
+    if workers < 1:
+        workers = os.cpu_count() or 1
+
+    if workers > 1:
+        # Multi-worker needs the import string; app_dir puts the repo
+        # root on sys.path, which script execution (python
+        # mock_sites/server.py) does not do on its own.
+        uvicorn.run(
+            "mock_sites.server:app",
+            host="0.0.0.0",
+            port=8080,
+            workers=workers,
+            app_dir=str(Path(__file__).resolve().parent.parent),
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+        )
+    else:
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=8080,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+        )
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Freeze evalset JSON files into a generated Python module.
+
+Importing literal dicts from a compiled .pyc goes through marshal's
+C-coded unmarshalling path, which is considerably faster than tokenizing
+and parsing the same structures as JSON at every test-session startup.
+The test loader in tests/conftest.py uses the generated module when it
+is present and still matches the source files, and silently falls back
+to parsing the JSON otherwise — so regeneration is an optimization, not
+a requirement.
+
+Usage:
+    python scripts/freeze_evalsets.py
+
+Re-run after editing any .evalset.json file. The generated module is
+not committed; it is a local/CI build artifact.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / "tests"
+EVALSETS_DIR = TESTS_DIR / "evalsets"
+OUTPUT_PATH = TESTS_DIR / "_evalsets_generated.py"
+
+_HEADER = """\
+# Auto-generated by scripts/freeze_evalsets.py -- do not edit.
+#
+# Literal dicts load from the compiled .pyc via marshal, skipping the
+# JSON parse at test-session startup. SOURCE_MTIMES lets the loader
+# detect staleness and fall back to parsing the JSON files directly.
+"""
+
+
+def freeze() -> Path:
+    """Write the generated module and return its path."""
+    evalsets: dict[tuple[str, str], dict] = {}
+    mtimes: dict[str, int] = {}
+
+    for path in sorted(EVALSETS_DIR.rglob("*.evalset.json")):
+        category = path.parent.name
+        name = path.name.removesuffix(".evalset.json")
+        evalsets[(category, name)] = json.loads(path.read_bytes())
+        mtimes[f"{category}/{path.name}"] = path.stat().st_mtime_ns
+
+    OUTPUT_PATH.write_text(
+        f"{_HEADER}\nSOURCE_MTIMES = {mtimes!r}\n\nEVALSETS = {evalsets!r}\n",
+        encoding="utf-8",
+    )
+    return OUTPUT_PATH
+
+
+if __name__ == "__main__":
+    output = freeze()
+    print(f"Wrote {output}")
@@ -7,25 +7,499 @@ form-filling tasks with Playwright MCP tools.
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import itertools
+import json
 import logging
-from typing import TYPE_CHECKING
-
-from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.adk.tools.mcp_tool import McpToolset, SseConnectionParams
-from google.genai import types
-
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+# Heavy google.adk / google.genai imports are deferred into the functions
+# that need them so short CLI paths (--help, --config) don't pay for them.
 from gui_agent.config import get_settings
 from gui_agent.observability import TracingContext
 from gui_agent.prompts import FORM_FILLING_SYSTEM_PROMPT
 
 if TYPE_CHECKING:
-    from google.adk.agents import Agent
+    from collections.abc import AsyncIterator
+
+    from google.adk.agents import LlmAgent
+    from google.adk.sessions import InMemorySessionService
+    from google.adk.tools.mcp_tool import McpToolset
 
 logger = logging.getLogger(__name__)
 
 
+# Interned so the per-tool-call name check is usually a pointer compare;
+# the callback runs for every tool invocation, not just screenshots.
+_TOOL_NAME_SCREENSHOT = sys.intern("browser_take_screenshot")
+
+# Compiled once; _sanitize_filename runs on every screenshot tool call
+_SANITIZE_RE = re.compile(r"[^\w\-.]")
+_COLLAPSE_RE = re.compile(r"_+")
+
+# Resolved from settings on first use, then reused for every screenshot.
+# Stored as a ready-made "dir/" string so the callback only concatenates.
+_screenshot_prefix: str | None = None
+
+# Timestamp strings only change once per second, so cache the formatted
+# value and disambiguate sub-second screenshots with a counter instead
+# of reformatting on every call.
+_ts_cache: tuple[int, str] = (0, "")
+_ts_counter = itertools.count()
+
+
+def _timestamp() -> str:
+    """Return a unique UTC timestamp string for screenshot filenames."""
+    global _ts_cache
+
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, time.strftime("%Y%m%d_%H%M%S", time.gmtime(sec)))
+    return f"{_ts_cache[1]}_{next(_ts_counter):04d}"
+
+
+def _sanitize_filename(name: str) -> str:
+    """Sanitize a filename for safe filesystem use.
+
+    Args:
+        name: The requested filename (possibly from the model).
+
+    Returns:
+        The name with unsafe characters replaced by underscores.
+    """
+    name = _SANITIZE_RE.sub("_", name)
+    return _COLLAPSE_RE.sub("_", name)
+
+
+def _get_screenshot_prefix() -> str:
+    """Get the screenshot path prefix, creating the directory on first use."""
+    global _screenshot_prefix
+
+    if _screenshot_prefix is None:
+        directory = Path(get_settings().screenshot_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        _screenshot_prefix = str(directory) + os.sep
+
+    return _screenshot_prefix
+
+
+# Tools available in @playwright/mcp that the agent may use.
+# See: https://github.com/microsoft/playwright-mcp
+_TOOL_FILTER: tuple[str, ...] = (
+    # Navigation
+    "browser_navigate",
+    "browser_go_back",
+    "browser_go_forward",
+    # Page state & content
+    "browser_snapshot",      # Returns accessibility tree with refs [ref=e1]
+    "browser_take_screenshot",
+    # Interactions (all use ref parameter from snapshot)
+    "browser_click",
+    "browser_type",
+    "browser_hover",
+    "browser_select_option",  # For dropdowns
+    "browser_press_key",
+    # Utilities
+    "browser_wait_for",
+)
+
+
+def _screenshot_callback(tool: Any, args: dict[str, Any], tool_context: Any = None) -> None:
+    """Route browser_take_screenshot output to the screenshot directory.
+
+    Registered as the agent's before_tool_callback, so it runs for every
+    tool call but only acts on browser_take_screenshot. It rewrites the
+    filename argument to a timestamped, sanitized path under
+    settings.screenshot_dir so screenshots are collected in one place.
+
+    Args:
+        tool: The tool about to be invoked.
+        args: The tool call arguments (mutated in place).
+        tool_context: ADK tool context (unused).
+
+    Returns:
+        None, so the tool call proceeds unchanged apart from the filename.
+    """
+    name = tool.name
+    if name is not _TOOL_NAME_SCREENSHOT and name != _TOOL_NAME_SCREENSHOT:
+        return None
+
+    original = args.get("filename") or "screenshot.png"
+    base_name = _sanitize_filename(os.path.basename(original) or "screenshot.png")
+    args["filename"] = _get_screenshot_prefix() + _timestamp() + "_" + base_name
+
+    logger.debug("Screenshot will be saved to %s", args["filename"])
+    return None
+
+
+# Priority per accessibility role when a snapshot exceeds the character
+# budget: interactive elements matter most for form filling, decorative
+# content is trimmed first.
+_ROLE_PRIORITY = {
+    "button": 100,
+    "textbox": 95,
+    "combobox": 90,
+    "checkbox": 90,
+    "radio": 90,
+    "listbox": 85,
+    "searchbox": 85,
+    "link": 80,
+    "option": 70,
+    "heading": 60,
+    "list": 40,
+    "listitem": 40,
+    "text": 30,
+    "paragraph": 30,
+    "img": 20,
+    "image": 20,
+    "generic": 10,
+}
+_DEFAULT_ROLE_PRIORITY = 50
+
+# Above this many interactive elements, the tree is too large to be useful
+# as text (trimming would discard most of it anyway) and traversal cost on
+# the browser side dominates; tell the model to work from screenshots.
+_SCREENSHOT_ONLY_REF_THRESHOLD = 5000
+
+
+# Pulls the accessibility role out of a snapshot line like
+# "  - textbox 'First Name' [ref=e3]" in one C-level match.
+_LINE_ROLE_RE = re.compile(r"[ \t\-]*[\"']?(\w+)")
+
+
+def _line_priority(line: str) -> int:
+    """Score a snapshot line by the priority of its accessibility role."""
+    match = _LINE_ROLE_RE.match(line)
+    if match is None:
+        return _DEFAULT_ROLE_PRIORITY
+    return _ROLE_PRIORITY.get(match.group(1), _DEFAULT_ROLE_PRIORITY)
+
+
+def _filter_snapshot_text(text: str, max_chars: int) -> str:
+    """Trim an accessibility snapshot to a character budget.
+
+    Keeps the highest-priority lines (interactive elements first) in
+    their original order and appends an explicit marker so the model
+    knows content was trimmed rather than absent.
+
+    Args:
+        text: The raw snapshot text.
+        max_chars: Budget in characters (~4 per token).
+
+    Returns:
+        The snapshot, trimmed if it exceeded the budget.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    refs = text.count("[ref=")
+    if refs > _SCREENSHOT_ONLY_REF_THRESHOLD:
+        return (
+            f"[snapshot dropped: {refs} interactive elements exceeds the "
+            f"{_SCREENSHOT_ONLY_REF_THRESHOLD}-element limit; use "
+            "browser_take_screenshot and work from the screenshot on this page]"
+        )
+
+    lines = text.splitlines()
+    # Highest priority first; ties keep document order
+    candidates = sorted(range(len(lines)), key=lambda i: (-_line_priority(lines[i]), i))
+
+    kept: set[int] = set()
+    budget = max_chars - 64  # Reserve room for the trimmed marker
+    for index in candidates:
+        cost = len(lines[index]) + 1
+        if cost > budget:
+            continue
+        kept.add(index)
+        budget -= cost
+
+    trimmed = len(lines) - len(kept)
+    output = [lines[i] for i in sorted(kept)]
+    output.append(f"[{trimmed} lower-priority elements trimmed]")
+    return "\n".join(output)
+
+
+def _filter_snapshot_response(tool_response: Any) -> Any:
+    """Apply the snapshot character budget to a tool response.
+
+    Handles both plain-text responses and the MCP content-part shape
+    ({"content": [{"type": "text", "text": ...}, ...]}); anything else
+    is returned untouched.
+
+    Args:
+        tool_response: The raw browser_snapshot response.
+
+    Returns:
+        The response with oversized text payloads trimmed, or None if
+        nothing needed trimming (so ADK keeps the original).
+    """
+    max_chars = get_settings().snapshot_max_chars
+
+    if isinstance(tool_response, str):
+        filtered = _filter_snapshot_text(tool_response, max_chars)
+        return filtered if filtered is not tool_response else None
+
+    if isinstance(tool_response, dict):
+        parts = tool_response.get("content")
+        if isinstance(parts, list):
+            changed = False
+            new_parts = []
+            for part in parts:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    filtered = _filter_snapshot_text(part["text"], max_chars)
+                    if filtered is not part["text"]:
+                        part = {**part, "text": filtered}
+                        changed = True
+                new_parts.append(part)
+            if changed:
+                return {**tool_response, "content": new_parts}
+
+    return None
+
+
+def _response_text(tool_response: Any) -> str | None:
+    """Pull the text payload out of a tool response, if there is one."""
+    if isinstance(tool_response, str):
+        return tool_response
+    if isinstance(tool_response, dict):
+        parts = tool_response.get("content")
+        if isinstance(parts, list):
+            texts = [
+                part["text"]
+                for part in parts
+                if isinstance(part, dict) and isinstance(part.get("text"), str)
+            ]
+            if texts:
+                return "\n".join(texts)
+    return None
+
+
+def _with_response_text(tool_response: Any, text: str) -> Any:
+    """Return a copy of a tool response with its text payload replaced."""
+    if isinstance(tool_response, str):
+        return text
+    return {**tool_response, "content": [{"type": "text", "text": text}]}
+
+
+# When less than this fraction of snapshot lines changed, send the model
+# a compact diff instead of the full tree.
+_DIFF_CHANGE_THRESHOLD = 0.30
+
+
+def _diff_snapshot_text(prev_lines: list[str] | None, new_text: str) -> str | None:
+    """Build a compact diff against the previous snapshot, if worthwhile.
+
+    Typical form filling mutates a handful of nodes between snapshots;
+    resending the whole tree wastes prompt tokens. When the overlap with
+    the previous snapshot is high enough, emit only the added and
+    removed lines.
+
+    Args:
+        prev_lines: Lines of the previous snapshot, or None.
+        new_text: The new snapshot text.
+
+    Returns:
+        The diff text, or None when a full snapshot should be sent.
+    """
+    if not prev_lines:
+        return None
+
+    new_lines = new_text.splitlines()
+    if not new_lines:
+        return None
+
+    prev_set = set(prev_lines)
+    new_set = set(new_lines)
+    added = [line for line in new_lines if line not in prev_set]
+    removed = [line for line in prev_lines if line not in new_set]
+
+    if (len(added) + len(removed)) / len(new_lines) >= _DIFF_CHANGE_THRESHOLD:
+        return None
+
+    if not added and not removed:
+        return "[snapshot unchanged since previous]"
+
+    out = ["[snapshot diff vs previous; unlisted elements are unchanged]"]
+    out.extend(f"+ {line}" for line in added)
+    out.extend(f"- {line}" for line in removed)
+    return "\n".join(out)
+
+
+# Lines of the last full snapshot per session, used to build diffs for
+# repeat calls. Keyed by session so one conversation's baseline never
+# produces a diff against a snapshot another conversation saw.
+_prev_snapshot_lines: dict[str, list[str]] = {}
+
+# SHA-256 of the last screenshot's image payload and the path it was
+# saved to, per session; repeat identical captures return a stub
+# instead of bytes.
+_last_screenshot: dict[str, tuple[bytes, str]] = {}
+
+
+def _session_key(tool_context: Any) -> str:
+    """Identify the session a tool callback belongs to.
+
+    ADK always passes a tool context at runtime; direct calls (tests)
+    may not, and those fall back to a single shared key.
+    """
+    if tool_context is None:
+        return ""
+    ctx = getattr(tool_context, "_invocation_context", None)
+    session_id = getattr(getattr(ctx, "session", None), "id", None)
+    return session_id if session_id is not None else ""
+
+
+def _screenshot_fingerprint(tool_response: Any) -> bytes | None:
+    """Compute a fingerprint of a screenshot response's image payload.
+
+    Prefers the base64 image data parts (stable across captures of an
+    unchanged page) over text parts, which may embed the per-call
+    filename.
+
+    Args:
+        tool_response: The raw browser_take_screenshot response.
+
+    Returns:
+        A SHA-256 digest, or None when no hashable payload was found.
+    """
+    payload: str | None = None
+
+    if isinstance(tool_response, dict):
+        parts = tool_response.get("content")
+        if isinstance(parts, list):
+            data = [
+                part["data"]
+                for part in parts
+                if isinstance(part, dict) and isinstance(part.get("data"), str)
+            ]
+            if data:
+                payload = "".join(data)
+
+    if payload is None:
+        payload = _response_text(tool_response)
+
+    if payload is None:
+        return None
+
+    return hashlib.sha256(payload.encode()).digest()
+
+
+# Tools whose execution can change the page, invalidating cached snapshots
+_MUTATING_TOOLS = frozenset(
+    {
+        "browser_navigate",
+        "browser_go_back",
+        "browser_go_forward",
+        "browser_click",
+        "browser_type",
+        "browser_select_option",
+        "browser_press_key",
+    }
+)
+
+# Bumped whenever a mutating tool runs; a cached snapshot is valid only
+# while the sequence number it was captured at is still current.
+_mutation_seq = 0
+_cached_snapshot: tuple[int, Any] | None = None
+
+
+def _snapshot_cache_callback(tool: Any, args: dict[str, Any], tool_context: Any = None) -> Any:
+    """Serve browser_snapshot from cache while the page is unchanged.
+
+    The prompt asks for a verification snapshot after each batch of
+    fills; when no mutating tool has run since the last snapshot, the
+    accessibility tree cannot have changed, so returning the cached
+    payload skips the MCP round-trip entirely (ADK treats a non-None
+    return from a before-tool callback as the tool's response).
+
+    Args:
+        tool: The tool about to be invoked.
+        args: The tool call arguments.
+        tool_context: ADK tool context (unused).
+
+    Returns:
+        The cached snapshot response, or None to run the tool.
+    """
+    if tool.name != "browser_snapshot":
+        return None
+
+    if _cached_snapshot is not None and _cached_snapshot[0] == _mutation_seq:
+        logger.debug("Serving browser_snapshot from cache (seq=%d)", _mutation_seq)
+        return _cached_snapshot[1]
+
+    return None
+
+
+def _before_tool_callback(tool: Any, args: dict[str, Any], tool_context: Any = None) -> Any:
+    """Dispatch before-tool hooks: snapshot cache, then screenshot naming."""
+    cached = _snapshot_cache_callback(tool, args, tool_context)
+    if cached is not None:
+        return cached
+    return _screenshot_callback(tool, args, tool_context)
+
+
+def _after_tool_callback(
+    tool: Any,
+    args: dict[str, Any],
+    tool_context: Any = None,
+    tool_response: Any = None,
+) -> Any | None:
+    """Track page mutations and capture snapshot responses for reuse.
+
+    Returns a replacement tool response (diff, dedup stub, or filtered
+    tree), or None to keep the original response.
+    """
+    global _mutation_seq, _cached_snapshot
+
+    name = tool.name
+    if name == "browser_take_screenshot":
+        digest = _screenshot_fingerprint(tool_response)
+        if digest is not None:
+            key = _session_key(tool_context)
+            last = _last_screenshot.get(key)
+            if last is not None and last[0] == digest:
+                # Identical capture: skip resending the image payload
+                return {"status": "unchanged", "ref": last[1]}
+            _last_screenshot[key] = (digest, str(args.get("filename", "")))
+        return None
+    if name == "browser_snapshot":
+        filtered = _filter_snapshot_response(tool_response)
+        if filtered is not None:
+            tool_response = filtered
+        replacement = filtered
+
+        # The cache keeps the full (filtered) tree; the model may get
+        # just a diff when little changed since the previous snapshot.
+        full_text = _response_text(tool_response)
+        if full_text is not None:
+            key = _session_key(tool_context)
+            diff = _diff_snapshot_text(_prev_snapshot_lines.get(key), full_text)
+            _prev_snapshot_lines[key] = full_text.splitlines()
+            if diff is not None:
+                replacement = _with_response_text(tool_response, diff)
+
+        _cached_snapshot = (_mutation_seq, tool_response)
+        return replacement
+    if name in _MUTATING_TOOLS:
+        _mutation_seq += 1
+        if name == "browser_navigate":
+            _last_screenshot.pop(_session_key(tool_context), None)
+    return None
+
+
+# Toolsets created this process, so shutdown can close their SSE
+# connections instead of leaving them to the garbage collector.
+_open_toolsets: list[Any] = []
+
+
+@functools.cache
 def create_playwright_toolset() -> McpToolset:
     """Create the Playwright MCP toolset.
 
@@ -33,35 +507,38 @@ def create_playwright_toolset() -> McpToolset:
     1. Call browser_snapshot to get accessibility tree with element refs
     2. Use ref parameter in subsequent tool calls (e.g., ref="e1")
 
+    Cached so repeat callers share one toolset (and its MCP connection
+    and tool-discovery handshake) instead of reallocating per call.
+
     Returns:
         McpToolset configured to connect to the Playwright MCP server.
     """
+    from google.adk.tools.mcp_tool import McpToolset, SseConnectionParams
+
     settings = get_settings()
 
-    return McpToolset(
+    toolset = McpToolset(
         connection_params=SseConnectionParams(
             url=settings.playwright_mcp_url,
         ),
-        # Filter to tools available in @playwright/mcp
-        # See: https://github.com/microsoft/playwright-mcp
-        tool_filter=[
-            # Navigation
-            "browser_navigate",
-            "browser_go_back",
-            "browser_go_forward",
-            # Page state & content
-            "browser_snapshot",      # Returns accessibility tree with refs [ref=e1]
-            "browser_take_screenshot",
-            # Interactions (all use ref parameter from snapshot)
-            "browser_click",
-            "browser_type",
-            "browser_hover",
-            "browser_select_option",  # For dropdowns
-            "browser_press_key",
-            # Utilities
-            "browser_wait_for",
-        ],
+        tool_filter=list(_TOOL_FILTER),
     )
+    _open_toolsets.append(toolset)
+    return toolset
+
+
+async def aclose_mcp_connections() -> None:
+    """Close the MCP connections held by toolsets created this process.
+
+    Best-effort: a toolset whose connection already dropped shouldn't
+    stop the rest from closing cleanly.
+    """
+    while _open_toolsets:
+        toolset = _open_toolsets.pop()
+        try:
+            await toolset.close()
+        except Exception:
+            logger.debug("MCP toolset close failed", exc_info=True)
 
 
 def create_form_filling_agent(
@@ -77,6 +554,8 @@ def create_form_filling_agent(
     Returns:
         Configured LlmAgent for form filling tasks.
     """
+    from google.adk.agents import LlmAgent
+
     settings = get_settings()
 
     if toolset is None:
@@ -87,9 +566,168 @@ def create_form_filling_agent(
         model=model or settings.model_name,
         instruction=FORM_FILLING_SYSTEM_PROMPT,
         tools=[toolset],
+        before_tool_callback=_before_tool_callback,
+        after_tool_callback=_after_tool_callback,
     )
 
 
+def _event_has_text(event: Any) -> bool:
+    """Check whether an ADK event carries any textual content.
+
+    Pure attribute probing with no string allocation, so the run loops
+    can track the last textual event by reference and defer the (one)
+    text join until after iteration finishes.
+
+    Args:
+        event: An event yielded by runner.run_async.
+
+    Returns:
+        True if _extract_event_text would return text for this event.
+    """
+    content = getattr(event, "content", None)
+    if content is None:
+        return False
+
+    parts = getattr(content, "parts", None)
+    if parts is None:
+        return bool(getattr(content, "text", None))
+
+    return any(getattr(part, "text", None) for part in parts)
+
+
+def _extract_event_text(event: Any) -> str | None:
+    """Extract the textual content from an ADK event, if any.
+
+    ADK emits many non-text events (tool calls, state deltas) per step,
+    so this bails out with a single getattr as early as possible instead
+    of probing every attribute on every event.
+
+    Args:
+        event: An event yielded by runner.run_async.
+
+    Returns:
+        The event's non-empty text parts joined, or None for non-text
+        events.
+    """
+    content = getattr(event, "content", None)
+    if content is None:
+        return None
+
+    parts = getattr(content, "parts", None)
+    if parts is None:
+        return getattr(content, "text", None) or None
+
+    texts = [text for part in parts if (text := getattr(part, "text", None))]
+    if not texts:
+        return None
+    return texts[0] if len(texts) == 1 else "".join(texts)
+
+
+# Shared across calls so sessions (and their history) survive between
+# tasks instead of being thrown away with a per-call service.
+_session_service: InMemorySessionService | None = None
+
+
+def _get_session_service() -> InMemorySessionService:
+    """Get or create the shared in-memory session service.
+
+    Returns:
+        The module-level InMemorySessionService instance.
+    """
+    global _session_service
+
+    if _session_service is None:
+        from google.adk.sessions import InMemorySessionService
+
+        _session_service = InMemorySessionService()
+
+    return _session_service
+
+
+# Runners are reused across tasks: building one per task re-creates the
+# agent and re-opens the MCP toolset's SSE connection every time.
+_runner_cache: dict[tuple[str, str], Any] = {}
+
+
+def _get_runner() -> Any:
+    """Get or create the Runner for the current settings.
+
+    Keyed by (model_name, playwright_mcp_url) so a settings change gets
+    a fresh runner while repeat tasks reuse the existing one.
+
+    Returns:
+        A Runner wired to the shared session service.
+    """
+    from google.adk.runners import Runner
+
+    settings = get_settings()
+    key = (settings.model_name, settings.playwright_mcp_url)
+
+    runner = _runner_cache.get(key)
+    if runner is None:
+        runner = Runner(
+            agent=create_form_filling_agent(),
+            app_name="gui-agent",
+            session_service=_get_session_service(),
+        )
+        _runner_cache[key] = runner
+
+    return runner
+
+
+def shutdown_caches() -> None:
+    """Tear down cached runners, toolsets, and session state.
+
+    Called on CLI exit so a fresh interactive session starts clean; also
+    useful in tests that need to reset module-level state.
+    """
+    global _session_service, _mcp_semaphore, _cached_snapshot
+
+    if _open_toolsets:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(aclose_mcp_connections())
+        else:
+            # Inside a loop the caller should await aclose_mcp_connections()
+            # first; dropping the references still lets GC reap transports.
+            _open_toolsets.clear()
+
+    _runner_cache.clear()
+    create_playwright_toolset.cache_clear()
+    _session_service = None
+    _mcp_semaphore = None
+    _cached_snapshot = None
+    _prev_snapshot_lines.clear()
+    _last_screenshot.clear()
+
+
+# Bounds how many tasks may drive the shared MCP connection at once.
+# Cached per event loop: run_task_sync/run_batch_sync each spin up a
+# fresh loop via asyncio.run, and a semaphore that ever had waiters
+# stays bound to the loop it first blocked on.
+_mcp_semaphore: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+def _get_mcp_semaphore() -> asyncio.Semaphore:
+    """Get or create the semaphore guarding concurrent MCP tool use.
+
+    Must be called from within a running event loop. A semaphore
+    created under an earlier, now-closed loop is replaced rather than
+    reused, since waiting on it from a different loop raises.
+
+    Returns:
+        The shared semaphore sized by settings.max_parallel_tasks.
+    """
+    global _mcp_semaphore
+
+    loop = asyncio.get_running_loop()
+    if _mcp_semaphore is None or _mcp_semaphore[0] is not loop:
+        _mcp_semaphore = (loop, asyncio.Semaphore(get_settings().max_parallel_tasks))
+
+    return _mcp_semaphore[1]
+
+
 # The root_agent is discovered by ADK CLI tools (adk web, adk run, etc.)
 # It's created lazily to allow configuration before instantiation
 _root_agent: LlmAgent | None = None
@@ -109,8 +747,8 @@ def get_root_agent() -> LlmAgent:
         settings = get_settings()
         settings.configure_environment()
         _root_agent = create_form_filling_agent()
-        logger.info(f"Created root agent with model: {settings.model_name}")
-        logger.info(f"Authentication mode: {settings.auth_mode}")
+        logger.info("Created root agent with model: %s", settings.model_name)
+        logger.info("Authentication mode: %s", settings.auth_mode)
 
     return _root_agent
 
@@ -119,6 +757,40 @@ def get_root_agent() -> LlmAgent:
 root_agent = property(lambda self: get_root_agent())
 
 
+def _build_user_message(text: str) -> Any:
+    """Build the user Content object for a task string.
+
+    Args:
+        text: The task text.
+
+    Returns:
+        A google.genai types.Content with a single text part.
+    """
+    from google.genai import types
+
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def build_form_task(url: str, form_data: dict[str, Any]) -> str:
+    """Build a form-filling task string with the data as compact JSON.
+
+    Prose like "the first name is John and the email is ..." costs more
+    prompt tokens than a JSON object and makes the model re-parse the
+    field mapping from natural language on every call. A compact JSON
+    block keeps the token count minimal and gives the model exact keys
+    to match against field labels.
+
+    Args:
+        url: The URL of the form to fill.
+        form_data: Field names mapped to the values to enter.
+
+    Returns:
+        A task string suitable for run_agent_task.
+    """
+    payload = json.dumps(form_data, separators=(",", ":"), ensure_ascii=False)
+    return f"Navigate to {url} and fill out the form with this data: {payload}"
+
+
 async def run_agent_task(
     task: str,
     user_id: str = "default_user",
@@ -137,58 +809,172 @@ async def run_agent_task(
     settings = get_settings()
     settings.configure_environment()
 
-    # Create session service
-    session_service = InMemorySessionService()
+    # Reuse the shared session service so history persists across calls
+    session_service = _get_session_service()
 
     # Generate session ID if not provided
     if session_id is None:
-        import uuid
+        session_id = uuid4().hex
 
-        session_id = str(uuid.uuid4())
-
-    # Create session (async in newer ADK versions)
-    await session_service.create_session(
+    # Create session unless the caller is continuing an existing one
+    existing = await session_service.get_session(
         app_name="gui-agent",
         user_id=user_id,
         session_id=session_id,
     )
+    if existing is None:
+        await session_service.create_session(
+            app_name="gui-agent",
+            user_id=user_id,
+            session_id=session_id,
+        )
 
-    # Create agent and runner
-    agent = create_form_filling_agent()
-    runner = Runner(
-        agent=agent,
-        app_name="gui-agent",
-        session_service=session_service,
-    )
+    runner = _get_runner()
 
-    logger.info(f"Starting task: {task[:100]}...")
+    logger.info("Starting task: %.100s...", task)
 
     # Run with tracing
     # runner.run_async returns an async generator, iterate over it
-    # Create Content object from task string
-    user_message = types.Content(
-        role="user",
-        parts=[types.Part(text=task)]
+    user_message = _build_user_message(task)
+
+    with TracingContext(settings):
+        # Track the last textual event by reference; the text itself is
+        # materialized once after the loop instead of per event.
+        last_text_event = None
+        # Limit concurrent use of the shared MCP connection
+        async with _get_mcp_semaphore():
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=user_message,
+            ):
+                if _event_has_text(event):
+                    last_text_event = event
+
+    final_response = _extract_event_text(last_text_event) or "" if last_text_event else ""
+    logger.info("Task completed. Response length: %d", len(final_response))
+    return final_response
+
+
+async def run_agent_tasks(
+    tasks: list[str],
+    user_id: str = "default_user",
+) -> list[str]:
+    """Run the agent on multiple tasks concurrently.
+
+    Unlike calling run_agent_task in a loop, this overlaps the LLM and MCP
+    network I/O for all tasks, so wall-time approaches the latency of the
+    slowest task rather than the sum of all of them.
+
+    Args:
+        tasks: The task descriptions to run.
+        user_id: User identifier for session tracking.
+
+    Returns:
+        The agent's final response for each task, in input order.
+    """
+    settings = get_settings()
+    settings.configure_environment()
+
+    session_service = _get_session_service()
+    session_ids = [uuid4().hex for _ in tasks]
+
+    # Create all sessions up front, in parallel
+    await asyncio.gather(
+        *(
+            session_service.create_session(
+                app_name="gui-agent",
+                user_id=user_id,
+                session_id=session_id,
+            )
+            for session_id in session_ids
+        )
     )
 
+    runner = _get_runner()
+
+    async def _collect(session_id: str, task: str) -> str:
+        """Run one task and return the last textual response."""
+        user_message = _build_user_message(task)
+
+        last_text_event = None
+        # Limit concurrent use of the shared MCP connection
+        async with _get_mcp_semaphore():
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=user_message,
+            ):
+                if _event_has_text(event):
+                    last_text_event = event
+        if last_text_event is None:
+            return ""
+        return _extract_event_text(last_text_event) or ""
+
+    logger.info("Starting batch of %d tasks", len(tasks))
+
     with TracingContext(settings):
-        final_response = ""
-        async for event in runner.run_async(
+        results = await asyncio.gather(
+            *(_collect(sid, task) for sid, task in zip(session_ids, tasks, strict=True))
+        )
+
+    logger.info("Batch completed. %d responses collected", len(results))
+    return list(results)
+
+
+async def stream_agent_task(
+    task: str,
+    user_id: str = "default_user",
+    session_id: str | None = None,
+) -> AsyncIterator[str]:
+    """Stream the agent's textual output for a task as it arrives.
+
+    Unlike run_agent_task, which buffers until the run completes, this
+    yields each non-empty text part as soon as ADK emits it, so callers
+    (CLIs, UIs) can display progress without waiting for the full run.
+
+    Args:
+        task: The task description.
+        user_id: User identifier for session tracking.
+        session_id: Optional session ID for conversation continuity.
+
+    Yields:
+        Each textual chunk produced by the agent, in order.
+    """
+    settings = get_settings()
+    settings.configure_environment()
+
+    session_service = _get_session_service()
+
+    if session_id is None:
+        session_id = uuid4().hex
+
+    existing = await session_service.get_session(
+        app_name="gui-agent",
+        user_id=user_id,
+        session_id=session_id,
+    )
+    if existing is None:
+        await session_service.create_session(
+            app_name="gui-agent",
             user_id=user_id,
             session_id=session_id,
-            new_message=user_message,
-        ):
-            # Extract text from various event types
-            if hasattr(event, "content") and event.content:
-                if hasattr(event.content, "parts"):
-                    for part in event.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            final_response = part.text
-                elif hasattr(event.content, "text"):
-                    final_response = event.content.text
-
-    logger.info(f"Task completed. Response length: {len(final_response)}")
-    return final_response
+        )
+
+    runner = _get_runner()
+
+    logger.info("Streaming task: %.100s...", task)
+
+    with TracingContext(settings):
+        async with _get_mcp_semaphore():
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=_build_user_message(task),
+            ):
+                text = _extract_event_text(event)
+                if text:
+                    yield text
 
 
 def run_task_sync(task: str, user_id: str = "default_user") -> str:
@@ -204,6 +990,19 @@ def run_task_sync(task: str, user_id: str = "default_user") -> str:
     return asyncio.run(run_agent_task(task, user_id))
 
 
+def run_batch_sync(tasks: list[str], user_id: str = "default_user") -> list[str]:
+    """Synchronous wrapper for run_agent_tasks.
+
+    Args:
+        tasks: The task descriptions to run.
+        user_id: User identifier.
+
+    Returns:
+        The agent's final response for each task, in input order.
+    """
+    return asyncio.run(run_agent_tasks(tasks, user_id))
+
+
 if __name__ == "__main__":
     # Simple test when run directly
     import sys
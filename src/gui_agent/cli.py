@@ -7,7 +7,7 @@ import asyncio
 import logging
 import sys
 
-from gui_agent.agent import run_agent_task
+from gui_agent.agent import aclose_mcp_connections, run_agent_task, shutdown_caches
 from gui_agent.config import get_settings
 from gui_agent.observability import TracingContext
 
@@ -35,6 +35,28 @@ def print_config(settings) -> None:
     print("=" * 60 + "\n")
 
 
+def _cmd_quit(settings) -> bool:
+    """Handle the quit command; returns True to exit the loop."""
+    print("Goodbye!")
+    return True
+
+
+def _cmd_config(settings) -> bool:
+    """Handle the config command."""
+    print_config(settings)
+    return False
+
+
+# Interactive commands, dispatched with one dict lookup per input. Each
+# handler takes the settings and returns True to leave the loop.
+_COMMANDS = {
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "q": _cmd_quit,
+    "config": _cmd_config,
+}
+
+
 async def interactive_mode() -> None:
     """Run the agent in interactive mode."""
     settings = get_settings()
@@ -51,31 +73,35 @@ async def interactive_mode() -> None:
     print("Type 'config' to show configuration")
     print()
 
-    with TracingContext(settings):
-        while True:
-            try:
-                task = input("📝 Enter task: ").strip()
-
-                if not task:
-                    continue
-
-                if task.lower() in ("quit", "exit", "q"):
-                    print("Goodbye!")
+    try:
+        with TracingContext(settings):
+            while True:
+                try:
+                    task = input("📝 Enter task: ").strip()
+
+                    if not task:
+                        continue
+
+                    handler = _COMMANDS.get(task.lower())
+                    if handler is not None:
+                        if handler(settings):
+                            break
+                        continue
+
+                    print("\n⏳ Processing...\n")
+                    result = await run_agent_task(task)
+                    print(f"\n✅ Result:\n{result}\n")
+
+                except KeyboardInterrupt:
+                    print("\n\nInterrupted. Goodbye!")
                     break
-
-                if task.lower() == "config":
-                    print_config(settings)
-                    continue
-
-                print("\n⏳ Processing...\n")
-                result = await run_agent_task(task)
-                print(f"\n✅ Result:\n{result}\n")
-
-            except KeyboardInterrupt:
-                print("\n\nInterrupted. Goodbye!")
-                break
-            except Exception as e:
-                print(f"\n❌ Error: {e}\n")
+                except Exception as e:
+                    print(f"\n❌ Error: {e}\n")
+    finally:
+        # Close the SSE connection while the loop is still running, then
+        # drop cached runners/toolsets so a restart starts clean
+        await aclose_mcp_connections()
+        shutdown_caches()
 
 
 async def single_task_mode(task: str) -> None:
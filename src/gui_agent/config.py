@@ -11,10 +11,10 @@ Authentication Priority:
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+from functools import cached_property
 from typing import Literal
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,6 +25,10 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Defaults are known-good literals; skipping their validation
+        # trims first-construction cost (values from the environment are
+        # still validated as usual).
+        validate_default=False,
     )
 
     # =========================================================================
@@ -52,6 +56,7 @@ class Settings(BaseSettings):
         alias="PLAYWRIGHT_MCP_URL",
     )
     browser_headless: bool = Field(default=True, alias="BROWSER_HEADLESS")
+    screenshot_dir: str = Field(default="screenshots", alias="SCREENSHOT_DIR")
     browser_timeout: int = Field(default=30, alias="BROWSER_TIMEOUT")
 
     # =========================================================================
@@ -63,12 +68,37 @@ class Settings(BaseSettings):
         default="http://localhost:6006/v1/traces",
         alias="PHOENIX_COLLECTOR_ENDPOINT",
     )
+    # Phoenix also accepts OTLP over gRPC (port 4317 in docker-compose),
+    # which keeps one persistent HTTP/2 connection instead of a request
+    # per export. "http" remains the default for compatibility.
+    otlp_protocol: Literal["http", "grpc"] = Field(default="http", alias="OTLP_PROTOCOL")
+    phoenix_collector_grpc_endpoint: str = Field(
+        default="http://localhost:4317",
+        alias="PHOENIX_COLLECTOR_GRPC_ENDPOINT",
+    )
     enable_tracing: bool = Field(default=True, alias="ENABLE_TRACING")
+    # Export each span synchronously (SimpleSpanProcessor) for immediate
+    # visibility while debugging; adds a network round-trip per span.
+    debug_tracing: bool = Field(default=False, alias="DEBUG_TRACING")
 
     # =========================================================================
     # Agent Configuration
     # =========================================================================
     max_agent_steps: int = Field(default=20, alias="MAX_AGENT_STEPS")
+    # Cap on concurrent tasks sharing the Playwright MCP connection.
+    # Similar in spirit to OLLAMA_NUM_PARALLEL: raise for more overlap,
+    # lower if the browser reports it is already in use.
+    max_parallel_tasks: int = Field(default=4, alias="GUI_AGENT_MAX_PARALLEL")
+    # Character budget for accessibility snapshots forwarded to the LLM
+    # (roughly 4 chars per token). Oversized trees are trimmed starting
+    # with the lowest-priority elements.
+    snapshot_max_chars: int = Field(default=32000, alias="SNAPSHOT_MAX_CHARS")
+
+    # =========================================================================
+    # Video Recording
+    # =========================================================================
+    video_dir: str = Field(default="recordings", alias="VIDEO_DIR")
+    video_retention_days: int = Field(default=7, alias="VIDEO_RETENTION_DAYS")
 
     # =========================================================================
     # Mock Server
@@ -76,6 +106,10 @@ class Settings(BaseSettings):
     mock_server_host: str = Field(default="localhost", alias="MOCK_SERVER_HOST")
     mock_server_port: int = Field(default=8080, alias="MOCK_SERVER_PORT")
 
+    # Tracks whether configure_environment has already run, so callers on
+    # the per-task hot path can invoke it unconditionally.
+    _env_configured: bool = PrivateAttr(default=False)
+
     @model_validator(mode="after")
     def validate_auth_config(self) -> "Settings":
         """Ensure valid authentication configuration."""
@@ -91,19 +125,24 @@ class Settings(BaseSettings):
 
         return self
 
-    @property
+    @cached_property
     def auth_mode(self) -> Literal["api_key", "vertex_ai"]:
-        """Return the active authentication mode."""
+        """Return the active authentication mode.
+
+        Cached (like the URL properties below) because the underlying
+        fields never change after validation and these feed logging and
+        repr paths that run per task.
+        """
         if self.google_api_key:
             return "api_key"
         return "vertex_ai"
 
-    @property
+    @cached_property
     def mock_server_url(self) -> str:
         """Return the full mock server URL."""
         return f"http://{self.mock_server_host}:{self.mock_server_port}"
 
-    @property
+    @cached_property
     def phoenix_ui_url(self) -> str:
         """Return the Phoenix UI URL."""
         return f"http://{self.phoenix_host}:{self.phoenix_port}"
@@ -112,19 +151,36 @@ class Settings(BaseSettings):
         """Set environment variables for ADK/genai library.
 
         This method sets the environment variables that the google-genai
-        library expects for authentication.
+        library expects for authentication. Idempotent: repeat calls are
+        no-ops, so per-task callers pay nothing after the first.
         """
-        if self.google_api_key:
-            os.environ["GOOGLE_API_KEY"] = self.google_api_key
+        if self._env_configured:
+            return
+
+        # Read the fields once from the model's backing dict; repeated
+        # attribute access goes through pydantic's descriptor machinery.
+        fields = self.__dict__
+        api_key = fields.get("google_api_key")
+
+        if api_key:
             # Ensure Vertex AI mode is disabled when using API key
-            os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "FALSE"
+            env = {
+                "GOOGLE_API_KEY": api_key,
+                "GOOGLE_GENAI_USE_VERTEXAI": "FALSE",
+            }
         else:
-            os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "TRUE"
-            os.environ["GOOGLE_CLOUD_PROJECT"] = self.google_cloud_project or ""
-            os.environ["GOOGLE_CLOUD_LOCATION"] = self.google_cloud_location
-
-    def __str__(self) -> str:
-        """Return a safe string representation (no secrets)."""
+            env = {
+                "GOOGLE_GENAI_USE_VERTEXAI": "TRUE",
+                "GOOGLE_CLOUD_PROJECT": fields.get("google_cloud_project") or "",
+                "GOOGLE_CLOUD_LOCATION": fields["google_cloud_location"],
+            }
+        os.environ.update(env)
+
+        self._env_configured = True
+
+    @cached_property
+    def _summary(self) -> str:
+        """Formatted settings summary, built once on first use."""
         return (
             f"Settings(\n"
             f"  auth_mode={self.auth_mode},\n"
@@ -138,13 +194,21 @@ class Settings(BaseSettings):
             f")"
         )
 
+    def __str__(self) -> str:
+        """Return a safe string representation (no secrets)."""
+        return self._summary
+
+
+_SETTINGS: Settings | None = None
+
 
-@lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance.
 
     Use this function to access settings throughout the application
-    to ensure consistent configuration.
+    to ensure consistent configuration. A plain module-level sentinel
+    rather than lru_cache: the steady-state call is one None check with
+    no argument hashing or cache bookkeeping.
 
     Returns:
         Settings: The application settings.
@@ -152,4 +216,19 @@ def get_settings() -> Settings:
     Raises:
         ValueError: If required configuration is missing.
     """
-    return Settings()
+    global _SETTINGS
+
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
+
+
+def _clear_settings() -> None:
+    """Drop the cached Settings so the next call rebuilds it."""
+    global _SETTINGS
+
+    _SETTINGS = None
+
+
+# Keep the lru_cache-style reset API that tests already rely on
+get_settings.cache_clear = _clear_settings  # type: ignore[attr-defined]
@@ -7,11 +7,14 @@ package to automatically instrument Google GenAI (Gemini) calls.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Generator
 
 from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
@@ -22,6 +25,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "setup_tracing",
+    "setup_genai_instrumentation",
+    "get_tracer",
+    "trace_operation",
+    "add_agent_attributes",
+    "record_tool_call",
+    "TracingContext",
+]
+
 
 def setup_tracing(settings: "Settings") -> TracerProvider | None:
     """Configure OpenTelemetry tracing for Phoenix.
@@ -49,20 +62,43 @@ def setup_tracing(settings: "Settings") -> TracerProvider | None:
     provider = TracerProvider(resource=resource)
 
     # Configure OTLP exporter to send traces to Phoenix
-    otlp_exporter = OTLPSpanExporter(
-        endpoint=settings.phoenix_collector_endpoint,
-    )
+    if settings.otlp_protocol == "grpc":
+        # One persistent HTTP/2 connection, cheaper serialization than
+        # protobuf-over-HTTP/1.1. Local Phoenix runs without TLS.
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter as GrpcOTLPSpanExporter,
+        )
+
+        otlp_exporter: GrpcOTLPSpanExporter | OTLPSpanExporter = GrpcOTLPSpanExporter(
+            endpoint=settings.phoenix_collector_grpc_endpoint,
+            insecure=True,
+        )
+    else:
+        # Span attributes (URLs, tool names, prompt text) are highly
+        # repetitive and gzip well, especially with batched exports.
+        otlp_exporter = OTLPSpanExporter(
+            endpoint=settings.phoenix_collector_endpoint,
+            compression=Compression.Gzip,
+        )
 
     # Use BatchSpanProcessor for production, SimpleSpanProcessor for debugging
     # BatchSpanProcessor is more efficient but may delay trace visibility
-    processor = BatchSpanProcessor(otlp_exporter)
+    if settings.debug_tracing:
+        processor: SimpleSpanProcessor | BatchSpanProcessor = SimpleSpanProcessor(otlp_exporter)
+    else:
+        processor = BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=2048,
+            max_export_batch_size=512,
+            schedule_delay_millis=500,
+        )
     provider.add_span_processor(processor)
 
     # Set as global tracer provider
     trace.set_tracer_provider(provider)
 
-    logger.info(f"Tracing configured - sending traces to {settings.phoenix_collector_endpoint}")
-    logger.info(f"View traces at {settings.phoenix_ui_url}")
+    logger.info("Tracing configured - sending traces to %s", settings.phoenix_collector_endpoint)
+    logger.info("View traces at %s", settings.phoenix_ui_url)
 
     return provider
 
@@ -84,7 +120,7 @@ def setup_genai_instrumentation() -> None:
             "Install it for automatic Gemini call tracing."
         )
     except Exception as e:
-        logger.warning(f"Failed to enable GenAI instrumentation: {e}")
+        logger.warning("Failed to enable GenAI instrumentation: %s", e)
 
 
 def get_tracer(name: str = "gui-agent") -> trace.Tracer:
@@ -158,7 +194,12 @@ def record_tool_call(
     if tool_input:
         span.set_attribute("tool.input", str(tool_input))
     if tool_output:
-        span.set_attribute("tool.output", str(tool_output)[:1000])  # Truncate long outputs
+        # Avoid copying outputs that are already strings within the limit;
+        # snapshots and screenshots can be many KB per agent turn.
+        output = tool_output if isinstance(tool_output, str) else str(tool_output)
+        if len(output) > 1000:
+            output = output[:1000]  # Truncate long outputs
+        span.set_attribute("tool.output", output)
 
 
 class TracingContext:
@@ -187,9 +228,31 @@ class TracingContext:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Flush and shut down tracing on context exit."""
-        if self.provider:
-            # Force flush any pending spans
-            self.provider.force_flush()
-            self.provider.shutdown()
+        """Flush and shut down tracing on context exit.
+
+        The flush runs off the caller's path so a slow OTLP endpoint
+        cannot block the user after a task completes; the provider's
+        atexit handler still guarantees a final flush. With
+        debug_tracing the flush stays synchronous so spans are visible
+        before control returns.
+        """
+        if self.provider is None:
+            return
+
+        provider = self.provider
+
+        def _flush_and_shutdown() -> None:
+            provider.force_flush(timeout_millis=5000)
+            provider.shutdown()
             logger.info("Tracing shut down - all spans flushed")
+
+        if self.settings.debug_tracing:
+            _flush_and_shutdown()
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            threading.Thread(target=_flush_and_shutdown, daemon=True).start()
+        else:
+            loop.run_in_executor(None, _flush_and_shutdown)
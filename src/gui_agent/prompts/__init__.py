@@ -2,12 +2,14 @@
 
 from gui_agent.prompts.system import (
     FORM_FILLING_SYSTEM_PROMPT,
+    FORM_FILLING_SYSTEM_PROMPT_BYTES,
     SCREENSHOT_ANALYSIS_PROMPT,
     SNAPSHOT_ANALYSIS_PROMPT,
 )
 
 __all__ = [
     "FORM_FILLING_SYSTEM_PROMPT",
+    "FORM_FILLING_SYSTEM_PROMPT_BYTES",
     "SCREENSHOT_ANALYSIS_PROMPT",
     "SNAPSHOT_ANALYSIS_PROMPT",
 ]
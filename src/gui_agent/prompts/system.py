@@ -27,11 +27,14 @@ You MUST follow this workflow for ALL interactions:
 
 ### Example Workflow:
 ```
-1. browser_navigate(url="https://example.com/form")
-2. browser_snapshot()  # Returns: "- textbox 'First Name' [ref=e3]..."
-3. browser_type(ref="e3", text="John")  # Use ref from snapshot
-4. browser_snapshot()  # Get updated refs after interaction
-5. browser_click(ref="e5")  # Click submit button
+1. browser_navigate(url="https://example.com/form")  # Issue together with
+2. browser_snapshot()  # ...the snapshot in the SAME turn - don't wait
+   # for the navigation result before requesting the snapshot.
+   # Returns: "- textbox 'First Name' [ref=e3]..."
+3. browser_type(ref="e3", text="John")   # Use refs from the one snapshot
+4. browser_type(ref="e4", text="Doe")    # No re-snapshot between fills
+5. browser_snapshot()  # One verification snapshot after the batch
+6. browser_click(ref="e5")  # Click submit button
 ```
 
 ### Tool Parameters:
@@ -48,18 +51,23 @@ You MUST follow this workflow for ALL interactions:
 
 ### 1. Understand Before Acting
 - ALWAYS call browser_snapshot first to understand the page layout
+- When starting with a navigation, request browser_navigate and
+  browser_snapshot together in one turn; they run in order and you get
+  the new page's tree without an extra round-trip
 - Identify all form fields and their refs before starting to fill them
 - Note any required fields (usually marked with * or "required")
 
 ### 2. Systematic Form Filling
 - Work through forms from top to bottom, left to right
-- Fill one field at a time using the ref from the snapshot
-- After each interaction, call browser_snapshot again to get updated refs
+- Collect ALL field refs from one snapshot, then fill every field in a
+  batch of consecutive tool calls without re-snapshotting between fills
+- Refs stay valid while the page structure is unchanged; only take a new
+  snapshot after the batch, after navigation, or if a ref stops working
 - For dropdowns, use browser_select_option with the ref and values array
 - Handle multi-step forms by completing each section before proceeding
 
 ### 3. Verification
-- After filling critical fields, call browser_snapshot to verify values
+- After filling a batch of fields, call browser_snapshot once to verify values
 - Before submitting, take a browser_take_screenshot to confirm all fields are filled
 - Look for validation errors in the snapshot and correct them
 
@@ -68,9 +76,14 @@ You MUST follow this workflow for ALL interactions:
 - If a field cannot be filled, note the issue and continue with other fields
 - Report any validation errors clearly
 - If the page structure is unexpected, take a screenshot and describe what you see
+- On very large pages the snapshot may be replaced with a "[snapshot dropped: ...]"
+  notice; switch to browser_take_screenshot and work visually instead of
+  requesting the tree again
 
 ## Form Data Handling
 When provided with form data, map it to the appropriate fields:
+- Form data usually arrives as a compact JSON object; match its keys to
+  field labels directly rather than re-deriving the mapping from prose
 - Match field labels to data keys (handle variations like "First Name" vs "firstName")
 - Use context to determine correct fields when labels are ambiguous
 - For dates, adapt to the expected format (MM/DD/YYYY, YYYY-MM-DD, etc.)
@@ -87,6 +100,11 @@ After completing a form:
 - If uncertain about a field's purpose, ask for clarification
 """
 
+# Pre-encoded once at import for callers that serialize the prompt into
+# HTTP bodies themselves; saves a ~2KB UTF-8 encode per request. ADK
+# callers keep using the str form above.
+FORM_FILLING_SYSTEM_PROMPT_BYTES = FORM_FILLING_SYSTEM_PROMPT.encode("utf-8")
+
 SCREENSHOT_ANALYSIS_PROMPT = """Analyze this screenshot of a web form. Identify:
 
 1. **Form Fields**: List all visible input fields with their labels and types
@@ -103,6 +121,12 @@ SNAPSHOT_ANALYSIS_PROMPT = """Analyze this browser_snapshot output (accessibilit
 The snapshot contains elements with refs like [ref=e1], [ref=e2], etc. that you can use
 to interact with elements.
 
+Snapshots may arrive in two formats:
+1. A full tree of elements
+2. A diff starting with "[snapshot diff vs previous; ...]" where lines
+   prefixed "+" were added and lines prefixed "-" were removed since the
+   previous snapshot; all unlisted elements (and their refs) are unchanged
+
 Identify:
 1. All interactive elements with their refs (inputs, buttons, links, dropdowns)
 2. Form structure and field groupings
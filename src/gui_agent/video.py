@@ -0,0 +1,403 @@
+"""Video recording management for debugging agent sessions.
+
+Playwright can record each browser session to a .webm file; this module
+owns where those recordings live, how long they are kept, and optional
+conversion to .mp4 for easier sharing. Recordings are named
+``session_<session_id>_<timestamp>.webm`` inside the configured
+recordings directory.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Annotation-only: Settings is never touched at runtime here, and a
+    # real import would pull pydantic into every consumer of this module.
+    # Keep it under TYPE_CHECKING.
+    from gui_agent.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Recording filename filter, matched with startswith/endswith instead of
+# a shell glob: fnmatch would translate and run a regex per entry.
+_RECORDING_PREFIX = "session_"
+_RECORDING_SUFFIX = ".webm"
+
+# Hardware H.264 encoders in preference order. Offloading the encode to
+# fixed-function silicon is 5-20x faster than libx264 on hosts that have
+# it; libx264 remains the portable fallback.
+_HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv", "h264_vaapi")
+
+# Quality arguments per encoder, roughly equivalent to libx264 -crf 23.
+_ENCODER_ARGS = {
+    "h264_nvenc": ("-preset", "p4", "-cq", "23"),
+    "h264_videotoolbox": ("-q:v", "65"),
+    "h264_qsv": ("-global_quality", "23"),
+    "h264_vaapi": ("-qp", "23"),
+    "libx264": ("-preset", "fast", "-crf", "23"),
+}
+
+
+def _encoder_works(encoder: str) -> bool:
+    """Check an encoder by encoding one tiny null-source frame.
+
+    ffmpeg's -encoders list only reflects compile-time support; static
+    builds routinely list h264_nvenc on hosts with no NVIDIA driver,
+    where every real encode then fails. A one-frame test encode proves
+    the encoder can actually open on this host.
+    """
+    try:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-f",
+                "lavfi",
+                "-i",
+                "color=c=black:s=64x64:d=0.1",
+                "-frames:v",
+                "1",
+                "-c:v",
+                encoder,
+                "-f",
+                "null",
+                "-",
+            ],
+            capture_output=True,
+            check=True,
+            timeout=15,
+        )
+    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        return False
+    return True
+
+
+@functools.cache
+def _detect_h264_encoder() -> str:
+    """Pick the best available H.264 encoder on this host.
+
+    Probes ffmpeg's encoder list once per process and test-encodes each
+    candidate, so an encoder that is compiled in but unusable (no GPU,
+    no driver) is skipped; every VideoManager shares the result.
+
+    Returns:
+        The encoder name to pass to -c:v (libx264 when no hardware
+        encoder is usable or ffmpeg is unavailable).
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "libx264"
+
+    for encoder in _HW_ENCODERS:
+        if encoder in result.stdout and _encoder_works(encoder):
+            return encoder
+    return "libx264"
+
+
+def _safe_unlink(path: str) -> int:
+    """Unlink one file, returning 1 on success and 0 on failure.
+
+    Shaped for executor.map so deletions can be counted with sum().
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        logger.warning("Could not delete recording %s: %s", path, e)
+        return 0
+    return 1
+
+
+def _probe_codecs(video_path: Path) -> tuple[str, ...] | None:
+    """Return the codec names of a file's streams via ffprobe.
+
+    Args:
+        video_path: Path to the media file.
+
+    Returns:
+        Codec names in stream order (video first), or None when probing
+        failed or ffprobe is unavailable.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "stream=codec_name",
+                "-of",
+                "csv=p=0",
+                str(video_path),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return tuple(line.strip() for line in result.stdout.splitlines() if line.strip())
+
+
+class VideoManager:
+    """Manage browser session recordings on disk."""
+
+    def __init__(self, settings: Settings) -> None:
+        """Set up the recordings directory.
+
+        Args:
+            settings: Application settings providing video_dir and
+                video_retention_days.
+        """
+        self.settings = settings
+        self.recordings_dir = Path(settings.video_dir)
+        self.recordings_dir.mkdir(parents=True, exist_ok=True)
+        # Cached once so get_video_path builds one f-string per call
+        # instead of going through PurePath concatenation.
+        self._dir_str = str(self.recordings_dir)
+        self._h264_encoder = _detect_h264_encoder()
+
+    def get_video_path(self, session_id: str) -> Path:
+        """Build the recording path for a new session.
+
+        Formats the timestamp from struct_time fields directly rather
+        than allocating a datetime and dispatching through strftime;
+        session creation can be bursty and this runs per session.
+
+        Args:
+            session_id: The session identifier to embed in the filename.
+
+        Returns:
+            Path for the session's .webm recording (not yet created).
+        """
+        # Index access on struct_time skips the named-attribute descriptors
+        t = time.localtime()
+        ts = f"{t[0]:04d}{t[1]:02d}{t[2]:02d}_{t[3]:02d}{t[4]:02d}{t[5]:02d}"
+        return Path(f"{self._dir_str}/session_{session_id}_{ts}.webm")
+
+    def cleanup_old_recordings(self) -> int:
+        """Delete recordings older than the retention window.
+
+        Scans with os.scandir rather than Path.glob: DirEntry caches the
+        stat from the directory read, so filtering and age-checking cost
+        one syscall per file instead of two, with no Path objects built
+        for entries that are skipped. When a retention sweep expires many
+        files at once, the unlinks are dispatched to a thread pool — the
+        filesystem handles concurrent unlinks fine and the syscalls
+        overlap instead of serializing.
+
+        Returns:
+            Number of recordings deleted.
+        """
+        # One float subtraction; datetime/timedelta arithmetic plus the
+        # tz conversion in .timestamp() is overkill for an age cutoff.
+        cutoff_ts = time.time() - self.settings.video_retention_days * 86400.0
+
+        stale: list[str] = []
+        with os.scandir(self._dir_str) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (
+                    name.startswith(_RECORDING_PREFIX) and name.endswith(_RECORDING_SUFFIX)
+                ):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff_ts:
+                        stale.append(entry.path)
+                except OSError:
+                    continue
+
+        if not stale:
+            return 0
+
+        if len(stale) <= 4:
+            # Not worth spinning up threads for a handful of files
+            deleted_count = sum(map(_safe_unlink, stale))
+        else:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                deleted_count = sum(executor.map(_safe_unlink, stale))
+
+        if deleted_count:
+            logger.info("Deleted %d recordings past retention", deleted_count)
+        return deleted_count
+
+    def get_recording_stats(self) -> dict[str, Any]:
+        """Summarize the recordings currently on disk.
+
+        One scandir pass tracks the running total and the oldest/newest
+        entries as it goes; each file is stat()ed exactly once and
+        nothing is sorted or materialized into a list.
+
+        Returns:
+            Dict with count, total_size_mb, and oldest/newest filenames
+            (None when there are no recordings).
+        """
+        count = 0
+        total_size = 0
+        oldest_mtime = float("inf")
+        newest_mtime = float("-inf")
+        oldest_name: str | None = None
+        newest_name: str | None = None
+
+        with os.scandir(self._dir_str) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (
+                    name.startswith(_RECORDING_PREFIX) and name.endswith(_RECORDING_SUFFIX)
+                ):
+                    continue
+                st = entry.stat()
+                count += 1
+                total_size += st.st_size
+                mtime = st.st_mtime
+                if mtime < oldest_mtime:
+                    oldest_mtime = mtime
+                    oldest_name = name
+                if mtime > newest_mtime:
+                    newest_mtime = mtime
+                    newest_name = name
+
+        return {
+            "count": count,
+            "total_size_mb": total_size / (1024 * 1024),
+            "oldest": oldest_name,
+            "newest": newest_name,
+        }
+
+    def convert_to_mp4(self, video_path: Path) -> Path | None:
+        """Convert a .webm recording to .mp4 with ffmpeg.
+
+        When the input streams are already MP4-compatible (H.264 video,
+        AAC audio) the file is remuxed with -c copy — a pure container
+        rewrap, 50-200x faster than re-encoding. Everything else goes
+        through the H.264 encode path.
+
+        ffmpeg's progress chatter is suppressed (-nostats -loglevel
+        error) and stdout discarded, so memory stays constant for long
+        encodes and the subprocess can never stall on a full pipe;
+        stderr carries only real error lines.
+
+        Args:
+            video_path: Path to the source recording.
+
+        Returns:
+            Path to the .mp4 file, or None if conversion failed.
+        """
+        output_path = video_path.with_suffix(".mp4")
+
+        codecs = _probe_codecs(video_path)
+        codec_args: tuple[str, ...]
+        if codecs and codecs[0] == "h264" and all(c in ("h264", "aac") for c in codecs):
+            codec_args = ("-c", "copy", "-movflags", "+faststart")
+        else:
+            codec_args = ("-c:v", self._h264_encoder, *_ENCODER_ARGS[self._h264_encoder])
+
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-nostats",
+                    "-loglevel",
+                    "error",
+                    "-i",
+                    str(video_path),
+                    *codec_args,
+                    str(output_path),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            logger.warning("ffmpeg not found; cannot convert %s", video_path)
+            return None
+        except subprocess.CalledProcessError as e:
+            logger.warning("Conversion of %s failed: %s", video_path, e.stderr)
+            return None
+        return output_path
+
+    def convert_many(self, paths: list[Path]) -> list[Path | None]:
+        """Convert a batch of recordings with a single ffmpeg process.
+
+        Forking ffmpeg costs ~50ms before any encoding starts; for
+        post-session batches of short recordings that overhead adds up.
+        All inputs are fed to one invocation, each mapped to its own
+        .mp4 output, so the process startup is paid once. If the batch
+        fails (one unreadable input fails the whole invocation), the
+        files are retried individually to salvage the good ones.
+
+        Args:
+            paths: Source recordings to convert.
+
+        Returns:
+            The .mp4 path for each input, in order, None where
+            conversion failed.
+        """
+        if not paths:
+            return []
+        if len(paths) == 1:
+            return [self.convert_to_mp4(paths[0])]
+
+        outputs = [path.with_suffix(".mp4") for path in paths]
+        codec_args = ("-c:v", self._h264_encoder, *_ENCODER_ARGS[self._h264_encoder])
+
+        cmd = ["ffmpeg", "-y", "-nostats", "-loglevel", "error"]
+        for path in paths:
+            cmd += ("-i", str(path))
+        for index, output_path in enumerate(outputs):
+            cmd += ("-map", str(index), *codec_args, str(output_path))
+
+        try:
+            subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            logger.warning("ffmpeg not found; cannot convert batch of %d", len(paths))
+            return [None] * len(paths)
+        except subprocess.CalledProcessError as e:
+            logger.warning("Batch conversion failed (%s); retrying per file", e.stderr)
+            return [self.convert_to_mp4(path) for path in paths]
+        return list(outputs)
+
+    def delete_recording(self, video_path: Path) -> bool:
+        """Delete a single recording.
+
+        Attempts the unlink directly rather than checking exists()
+        first — the pre-check is an extra stat syscall and a race (the
+        file can vanish between check and unlink either way).
+
+        Args:
+            video_path: Path to the recording to remove.
+
+        Returns:
+            True if the file was deleted, False otherwise.
+        """
+        try:
+            os.unlink(video_path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning("Could not delete recording %s: %s", video_path, e)
+            return False
+        return True
@@ -10,18 +10,32 @@ This module provides fixtures for:
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import subprocess
 import time
+from collections.abc import Generator, Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+# orjson parses several times faster than stdlib json; fall back to the
+# stdlib when the mock-server extra isn't installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 if TYPE_CHECKING:
     from gui_agent.config import Settings
 
+# Computed once at import; fixtures below derive their paths from these
+# instead of rebuilding Path(__file__) chains per call.
+_TESTS_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _TESTS_DIR.parent
+
 
 # =============================================================================
 # Configuration Fixtures
@@ -95,6 +109,7 @@ def mock_server_process() -> Generator[subprocess.Popen | None, None, None]:
 
     def is_port_open(port: int) -> bool:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.1)
             return s.connect_ex(("localhost", port)) == 0
 
     if is_port_open(8080):
@@ -105,17 +120,20 @@ def mock_server_process() -> Generator[subprocess.Popen | None, None, None]:
     # Start the mock server
     process = subprocess.Popen(
         ["uvicorn", "mock_sites.server:app", "--host", "0.0.0.0", "--port", "8080"],
-        cwd=Path(__file__).parent.parent,
+        cwd=_REPO_ROOT,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
 
-    # Wait for server to start
-    max_retries = 30
-    for _ in range(max_retries):
+    # Wait for the server with exponential backoff: the common fast
+    # start is detected within ~50-100ms instead of a fixed 0.5s sleep.
+    deadline = time.monotonic() + 15
+    delay = 0.05
+    while time.monotonic() < deadline:
         if is_port_open(8080):
             break
-        time.sleep(0.5)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
     else:
         process.kill()
         raise RuntimeError("Mock server failed to start")
@@ -132,25 +150,160 @@ def mock_server_process() -> Generator[subprocess.Popen | None, None, None]:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evalset_dir() -> Path:
     """Return the path to evaluation sets."""
-    return Path(__file__).parent / "evalsets"
+    return _TESTS_DIR / "evalsets"
 
 
-@pytest.fixture
-def load_evalset(evalset_dir: Path):
-    """Factory fixture to load evaluation sets."""
+def _frozen_evalsets(evalset_dir: Path) -> dict[tuple[str, str], Any] | None:
+    """Load the module generated by scripts/freeze_evalsets.py, if fresh.
+
+    Importing literal dicts from a .pyc skips JSON parsing entirely.
+    Returns None when the module is absent or any source file changed
+    since it was generated — the loader then parses the JSON directly.
+    """
+    gen_path = _TESTS_DIR / "_evalsets_generated.py"
+    if not gen_path.exists():
+        return None
+
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("_evalsets_generated", gen_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    sources = {
+        f"{p.parent.name}/{p.name}": p.stat().st_mtime_ns
+        for p in evalset_dir.rglob("*.evalset.json")
+    }
+    if module.SOURCE_MTIMES != sources:
+        return None
+    return module.EVALSETS
+
+
+# Parsed evalsets for the whole session: parametrized tests ask for the
+# same files repeatedly, and they never change mid-run. Entries are
+# wrapped in MappingProxyType because the same object is handed to every
+# test — a stray mutation in one test must not leak into the others.
+_EVALSET_CACHE: dict[tuple[str, str], Mapping[str, Any]] = {}
 
-    def _load(category: str, name: str) -> dict[str, Any]:
-        evalset_path = evalset_dir / category / f"{name}.evalset.json"
-        if not evalset_path.exists():
-            raise FileNotFoundError(f"EvalSet not found: {evalset_path}")
-        return json.loads(evalset_path.read_text())
+
+@pytest.fixture(scope="session")
+def load_evalset(evalset_dir: Path):
+    """Factory fixture to load evaluation sets (parsed once per file)."""
+    frozen = _frozen_evalsets(evalset_dir)
+
+    def _load(category: str, name: str) -> Mapping[str, Any]:
+        key = (category, name)
+        evalset = _EVALSET_CACHE.get(key)
+        if evalset is None:
+            if frozen is not None and key in frozen:
+                evalset = MappingProxyType(frozen[key])
+            else:
+                evalset_path = evalset_dir / category / f"{name}.evalset.json"
+                if not evalset_path.exists():
+                    raise FileNotFoundError(f"EvalSet not found: {evalset_path}")
+                # read_bytes + loads skips the intermediate str decode
+                evalset = MappingProxyType(_json_loads(evalset_path.read_bytes()))
+            _EVALSET_CACHE[key] = evalset
+        return evalset
 
     return _load
 
 
+@dataclass(frozen=True)
+class ValidatedEvalset:
+    """A structurally validated evalset with precomputed indexes.
+
+    Built once per evalset per session so structural checks and the
+    dict walks behind them are not repeated across tests.
+    """
+
+    evalset: Mapping[str, Any]
+    case_ids: frozenset[str]
+    cases_by_id: Mapping[str, Any]
+    tool_names_by_case: Mapping[str, tuple[str, ...]]
+    snapshot_counts_by_case: Mapping[str, int]
+
+
+def _validate_evalset(evalset: Mapping[str, Any]) -> None:
+    """Check the structural invariants every evalset must satisfy."""
+    assert "eval_set_id" in evalset
+    assert evalset["eval_cases"], "Evalset has no cases"
+    for case in evalset["eval_cases"]:
+        assert "eval_case_id" in case
+        assert case["conversation"], f"{case.get('eval_case_id')} has no conversation"
+        assert case["conversation"][0]["role"] == "user"
+
+
+# Validated evalsets with their indexes, built lazily on first request.
+_VALIDATED_CACHE: dict[tuple[str, str], ValidatedEvalset] = {}
+
+
+@pytest.fixture(scope="session")
+def validated_evalset(load_evalset):
+    """Factory fixture returning a validated, indexed evalset."""
+
+    def _get(category: str, name: str) -> ValidatedEvalset:
+        key = (category, name)
+        validated = _VALIDATED_CACHE.get(key)
+        if validated is None:
+            evalset = load_evalset(category, name)
+            _validate_evalset(evalset)
+            index = {c["eval_case_id"]: c for c in evalset["eval_cases"]}
+            tool_names = {
+                case_id: tuple(tc["tool_name"] for tc in case.get("expected_tool_calls", []))
+                for case_id, case in index.items()
+            }
+            validated = ValidatedEvalset(
+                evalset=evalset,
+                case_ids=frozenset(index),
+                cases_by_id=MappingProxyType(index),
+                tool_names_by_case=MappingProxyType(tool_names),
+                snapshot_counts_by_case=MappingProxyType(
+                    {
+                        case_id: names.count("browser_snapshot")
+                        for case_id, names in tool_names.items()
+                    }
+                ),
+            )
+            _VALIDATED_CACHE[key] = validated
+        return validated
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def cases_by_id(validated_evalset):
+    """Factory fixture returning a case-id index for an evalset."""
+
+    def _index(category: str, name: str) -> Mapping[str, Any]:
+        return validated_evalset(category, name).cases_by_id
+
+    return _index
+
+
+@pytest.fixture(scope="session")
+def tool_names_for(validated_evalset):
+    """Factory fixture returning a case's expected tool names as a tuple."""
+
+    def _names(category: str, name: str, case_id: str) -> tuple[str, ...]:
+        return validated_evalset(category, name).tool_names_by_case[case_id]
+
+    return _names
+
+
+@pytest.fixture(scope="session")
+def case_ids(validated_evalset):
+    """Factory fixture returning the frozen case-id set for an evalset."""
+
+    def _ids(category: str, name: str) -> frozenset[str]:
+        return validated_evalset(category, name).case_ids
+
+    return _ids
+
+
 @pytest.fixture
 def form_filling_data() -> dict[str, str]:
     """Provide standard form data for testing."""
@@ -232,3 +385,32 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "slow: marks tests as slow")
     config.addinivalue_line("markers", "integration: marks tests requiring external services")
     config.addinivalue_line("markers", "evalset: marks tests using ADK evaluation format")
+    config.addinivalue_line(
+        "markers", "evalset_schema: static evalset JSON schema validation"
+    )
+
+
+# Structural evalset checks only catch regressions when the JSON files
+# change; skip them on ordinary local runs and let CI (or an explicit
+# opt-in) run the full validation.
+_SCHEMA_SKIP = pytest.mark.skip(
+    reason="evalset schema checks disabled (set RUN_EVALSET_SCHEMA=1)"
+)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Fail fast if the same test id is ever collected twice.
+
+    Duplicate collection (e.g. a module imported under two names)
+    silently doubles runtime; catching it here keeps that from creeping
+    in unnoticed. Also default-skips the static evalset schema checks
+    outside CI unless explicitly requested.
+    """
+    seen = {item.nodeid for item in items}
+    assert len(seen) == len(items), "Duplicate test ids collected"
+
+    if os.environ.get("RUN_EVALSET_SCHEMA") or os.environ.get("CI"):
+        return
+    for item in items:
+        if "evalset_schema" in item.keywords:
+            item.add_marker(_SCHEMA_SKIP)
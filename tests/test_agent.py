@@ -6,9 +6,13 @@ ADK evaluation format adapted for pytest.
 
 from __future__ import annotations
 
-import json
+import os
+import re
+from collections import Counter
+from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
 
 import pytest
 
@@ -16,6 +20,39 @@ if TYPE_CHECKING:
     from gui_agent.config import Settings
 
 
+# Tool names evalset cases may reference. Built once at import as a
+# frozenset (cheapest membership checks) rather than per test call.
+_KNOWN_TOOLS: frozenset[str] = frozenset(
+    {
+        "browser_navigate",
+        "browser_snapshot",
+        "browser_click",
+        "browser_type",
+        "browser_hover",
+        "browser_select_option",
+        "browser_screenshot",
+        "browser_take_screenshot",
+        "browser_press_key",
+    }
+)
+
+# Compiled once at import: date inputs only accept YYYY-MM-DD, so evalset
+# trajectories must type dates in ISO format.
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _last_index(items: Sequence[str], value: str) -> int:
+    """Return the last index of value in items, or -1 if absent.
+
+    Single reverse scan — the lst[::-1].index(...) idiom allocates a
+    full reversed copy of the list just to find one element.
+    """
+    for i in range(len(items) - 1, -1, -1):
+        if items[i] == value:
+            return i
+    return -1
+
+
 # =============================================================================
 # Unit Tests (No external services required)
 # =============================================================================
@@ -47,30 +84,305 @@ class TestAgentCreation:
         assert agent.model == "gemini-2.0-flash"
 
 
+@pytest.fixture(scope="session")
+def form_prompt_lower() -> str:
+    """Lowercased form-filling prompt, built once for the session.
+
+    The prompt is a multi-KB constant; lowercasing it per test copies
+    the whole string each time.
+    """
+    from gui_agent.prompts import FORM_FILLING_SYSTEM_PROMPT
+
+    return FORM_FILLING_SYSTEM_PROMPT.lower()
+
+
 class TestSystemPrompts:
     """Tests for system prompts."""
 
-    def test_form_filling_prompt_content(self):
+    def test_form_filling_prompt_content(self, form_prompt_lower: str):
         """Test that the form filling prompt contains expected guidance."""
-        from gui_agent.prompts import FORM_FILLING_SYSTEM_PROMPT
-
-        prompt = FORM_FILLING_SYSTEM_PROMPT.lower()
-
         # Should mention key capabilities
-        assert "form" in prompt
-        assert "fill" in prompt
-        assert "screenshot" in prompt
-        assert "verification" in prompt
+        assert "form" in form_prompt_lower
+        assert "fill" in form_prompt_lower
+        assert "screenshot" in form_prompt_lower
+        assert "verification" in form_prompt_lower
 
-    def test_prompt_includes_safety_guidelines(self):
+    def test_prompt_includes_safety_guidelines(self, form_prompt_lower: str):
         """Test that prompts include safety considerations."""
-        from gui_agent.prompts import FORM_FILLING_SYSTEM_PROMPT
+        # Should have safety guidelines
+        assert "password" in form_prompt_lower or "payment" in form_prompt_lower
+        assert "submit" in form_prompt_lower
 
-        prompt = FORM_FILLING_SYSTEM_PROMPT.lower()
 
-        # Should have safety guidelines
-        assert "password" in prompt or "payment" in prompt
-        assert "submit" in prompt
+class TestEventTextExtraction:
+    """Tests for the ADK event text extractor."""
+
+    def test_joins_text_parts(self):
+        """Test that non-empty text parts are joined in order."""
+        from types import SimpleNamespace
+
+        from gui_agent.agent import _event_has_text, _extract_event_text
+
+        event = SimpleNamespace(
+            content=SimpleNamespace(
+                parts=[
+                    SimpleNamespace(text="first"),
+                    SimpleNamespace(text=None),
+                    SimpleNamespace(text="last"),
+                ]
+            )
+        )
+
+        assert _event_has_text(event)
+        assert _extract_event_text(event) == "firstlast"
+
+    def test_non_text_event_returns_none(self):
+        """Test that events without content are skipped cheaply."""
+        from types import SimpleNamespace
+
+        from gui_agent.agent import _extract_event_text
+
+        assert _extract_event_text(SimpleNamespace(content=None)) is None
+        assert _extract_event_text(SimpleNamespace()) is None
+
+
+class TestBuildFormTask:
+    """Tests for the form-task builder."""
+
+    def test_form_data_rendered_as_compact_json(self):
+        """Test that form data is embedded without prose or whitespace."""
+        from gui_agent.agent import build_form_task
+
+        task = build_form_task(
+            "http://localhost:8080/simple",
+            {"first_name": "John", "email": "john@example.com"},
+        )
+
+        assert "http://localhost:8080/simple" in task
+        assert '{"first_name":"John","email":"john@example.com"}' in task
+
+
+@pytest.fixture
+def screenshot_tool() -> Mock:
+    """A tool mock preconfigured as the screenshot tool.
+
+    The callback tests only ever read tool.name, so one fixture covers
+    them all instead of each test building and naming its own Mock.
+    """
+    tool = Mock()
+    tool.name = "browser_take_screenshot"
+    return tool
+
+
+class TestScreenshotCallback:
+    """Tests for the before-tool screenshot callback."""
+
+    def test_sanitize_filename(self):
+        """Test that unsafe characters are replaced."""
+        from gui_agent.agent import _sanitize_filename
+
+        assert _sanitize_filename("my file (1).png") == "my_file_1_.png"
+        assert _sanitize_filename("../../etc/passwd") == ".._.._etc_passwd"
+
+    def test_screenshot_callback_rewrites_filename(self, tmp_path, monkeypatch, screenshot_tool):
+        """Test that screenshot calls get a timestamped path in the dir."""
+        import gui_agent.agent as agent_module
+
+        monkeypatch.setattr(agent_module, "_screenshot_prefix", f"{tmp_path}/")
+
+        args = {"filename": "test.png"}
+
+        result = agent_module._screenshot_callback(screenshot_tool, args)
+
+        assert result is None
+        assert args["filename"].startswith(str(tmp_path))
+        assert args["filename"].endswith("_test.png")
+
+    def test_screenshot_callback_strips_directories(self, tmp_path, monkeypatch, screenshot_tool):
+        """Test that model-supplied paths are reduced to their basename."""
+        import gui_agent.agent as agent_module
+
+        monkeypatch.setattr(agent_module, "_screenshot_prefix", f"{tmp_path}/")
+
+        args = {"filename": "../outside/shot.png"}
+
+        agent_module._screenshot_callback(screenshot_tool, args)
+
+        assert args["filename"].startswith(str(tmp_path))
+        assert args["filename"].endswith("_shot.png")
+        assert ".." not in args["filename"]
+
+    def test_screenshot_callback_ignores_other_tools(self, screenshot_tool):
+        """Test that non-screenshot tool calls pass through untouched."""
+        import gui_agent.agent as agent_module
+
+        tool = screenshot_tool
+        tool.name = "browser_click"
+        args = {"ref": "e3"}
+
+        result = agent_module._screenshot_callback(tool, args)
+
+        assert result is None
+        assert args == {"ref": "e3"}
+
+
+class TestSnapshotFiltering:
+    """Tests for the snapshot character-budget filter."""
+
+    def test_small_snapshot_untouched(self):
+        """Test that snapshots within budget pass through unchanged."""
+        from gui_agent.agent import _filter_snapshot_text
+
+        text = "- textbox 'First Name' [ref=e3]\n- button 'Submit' [ref=e5]"
+
+        assert _filter_snapshot_text(text, 1000) is text
+
+    def test_oversized_snapshot_keeps_interactive_elements(self):
+        """Test that trimming drops decorative content before inputs."""
+        from gui_agent.agent import _filter_snapshot_text
+
+        filler = [f"- img 'decoration {i}' [ref=e{i}]" for i in range(100)]
+        lines = [
+            "- textbox 'Email' [ref=e200]",
+            *filler,
+            "- button 'Submit' [ref=e201]",
+        ]
+        text = "\n".join(lines)
+
+        result = _filter_snapshot_text(text, 500)
+
+        assert "textbox 'Email'" in result
+        assert "button 'Submit'" in result
+        assert "elements trimmed]" in result
+        assert len(result) <= 500
+
+    def test_huge_tree_falls_back_to_screenshot_notice(self):
+        """Test that trees past the ref limit are dropped entirely."""
+        from gui_agent.agent import _filter_snapshot_text
+
+        text = "\n".join(f"- link 'item {i}' [ref=e{i}]" for i in range(5001))
+
+        result = _filter_snapshot_text(text, 500)
+
+        assert result.startswith("[snapshot dropped:")
+        assert "browser_take_screenshot" in result
+
+
+class TestSnapshotDiff:
+    """Tests for diffing repeat snapshots."""
+
+    def test_no_previous_snapshot_returns_none(self):
+        """Test that the first snapshot is always sent in full."""
+        from gui_agent.agent import _diff_snapshot_text
+
+        assert _diff_snapshot_text(None, "- button 'Submit' [ref=e1]") is None
+
+    def test_small_change_produces_diff(self):
+        """Test that a one-field change yields a compact diff."""
+        from gui_agent.agent import _diff_snapshot_text
+
+        prev = [f"- textbox 'Field {i}' [ref=e{i}]" for i in range(20)]
+        new_lines = list(prev)
+        new_lines[3] = "- textbox 'Field 3' [ref=e3]: John"
+
+        diff = _diff_snapshot_text(prev, "\n".join(new_lines))
+
+        assert diff is not None
+        assert "+ - textbox 'Field 3' [ref=e3]: John" in diff
+        assert "- - textbox 'Field 3' [ref=e3]" in diff
+        assert "Field 10" not in diff
+
+    def test_large_change_falls_back_to_full_tree(self):
+        """Test that a mostly-new page is sent in full."""
+        from gui_agent.agent import _diff_snapshot_text
+
+        prev = [f"- textbox 'Old {i}' [ref=e{i}]" for i in range(10)]
+        new_text = "\n".join(f"- textbox 'New {i}' [ref=e{i}]" for i in range(10))
+
+        assert _diff_snapshot_text(prev, new_text) is None
+
+
+class TestSnapshotCache:
+    """Tests for the snapshot cache tool callbacks."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self, monkeypatch):
+        """Reset the module-level cache state for each test."""
+        import gui_agent.agent as agent_module
+
+        monkeypatch.setattr(agent_module, "_mutation_seq", 0)
+        monkeypatch.setattr(agent_module, "_cached_snapshot", None)
+        monkeypatch.setattr(agent_module, "_prev_snapshot_lines", {})
+        monkeypatch.setattr(agent_module, "_last_screenshot", {})
+
+    def _tool(self, name: str):
+        from unittest.mock import Mock
+
+        tool = Mock()
+        tool.name = name
+        return tool
+
+    def test_snapshot_served_from_cache_when_unchanged(self):
+        """Test that a repeat snapshot skips the MCP call."""
+        import gui_agent.agent as agent_module
+
+        snapshot_tool = self._tool("browser_snapshot")
+        response = {"tree": "- textbox 'First Name' [ref=e3]"}
+
+        # First snapshot: no cache yet, response gets recorded
+        assert agent_module._before_tool_callback(snapshot_tool, {}) is None
+        agent_module._after_tool_callback(snapshot_tool, {}, tool_response=response)
+
+        # Second snapshot with no mutation in between: cache hit
+        assert agent_module._before_tool_callback(snapshot_tool, {}) == response
+
+    def test_mutating_tool_invalidates_cache(self):
+        """Test that page-changing tools force a fresh snapshot."""
+        import gui_agent.agent as agent_module
+
+        snapshot_tool = self._tool("browser_snapshot")
+        response = {"tree": "- textbox 'First Name' [ref=e3]"}
+
+        agent_module._after_tool_callback(snapshot_tool, {}, tool_response=response)
+
+        click_tool = self._tool("browser_click")
+        agent_module._after_tool_callback(click_tool, {"ref": "e5"}, tool_response={})
+
+        assert agent_module._before_tool_callback(snapshot_tool, {}) is None
+
+    def test_identical_screenshot_deduplicated(self):
+        """Test that a repeat identical capture returns a stub."""
+        import gui_agent.agent as agent_module
+
+        shot_tool = self._tool("browser_take_screenshot")
+        response = {"content": [{"type": "image", "data": "aGVsbG8="}]}
+
+        first = agent_module._after_tool_callback(
+            shot_tool, {"filename": "shots/a.png"}, tool_response=response
+        )
+        second = agent_module._after_tool_callback(
+            shot_tool, {"filename": "shots/b.png"}, tool_response=response
+        )
+
+        assert first is None
+        assert second == {"status": "unchanged", "ref": "shots/a.png"}
+
+    def test_navigation_resets_screenshot_dedup(self):
+        """Test that navigating clears the screenshot fingerprint."""
+        import gui_agent.agent as agent_module
+
+        shot_tool = self._tool("browser_take_screenshot")
+        response = {"content": [{"type": "image", "data": "aGVsbG8="}]}
+
+        agent_module._after_tool_callback(shot_tool, {"filename": "a.png"}, tool_response=response)
+
+        nav_tool = self._tool("browser_navigate")
+        agent_module._after_tool_callback(nav_tool, {"url": "http://x"}, tool_response={})
+
+        again = agent_module._after_tool_callback(
+            shot_tool, {"filename": "b.png"}, tool_response=response
+        )
+        assert again is None
 
 
 # =============================================================================
@@ -78,34 +390,52 @@ class TestSystemPrompts:
 # =============================================================================
 
 
+@pytest.mark.evalset_schema
 class TestEvalSetLoader:
     """Tests for loading and validating eval sets."""
 
-    def test_load_basic_evalset(self, evalset_dir: Path):
+    def test_load_basic_evalset(self, evalset_dir: Path, load_evalset):
         """Test loading the basic form filling eval set."""
         evalset_path = evalset_dir / "form_filling" / "basic.evalset.json"
 
         assert evalset_path.exists(), f"EvalSet not found: {evalset_path}"
 
-        with open(evalset_path) as f:
-            evalset = json.load(f)
+        # Shared session-cached loader: no second read + parse of a file
+        # every other evalset test already loads
+        evalset = load_evalset("form_filling", "basic")
 
         assert "eval_set_id" in evalset
         assert "eval_cases" in evalset
         assert len(evalset["eval_cases"]) > 0
 
-    def test_evalset_structure(self, load_evalset):
-        """Test that eval set has required structure."""
+    @pytest.mark.parametrize("name", ["basic", "complex"])
+    def test_evalset_structure(self, name: str, validated_evalset):
+        """Test that eval sets pass structural validation.
+
+        The per-case schema walk happens once inside the session-scoped
+        validated_evalset fixture; this just confirms it ran and that
+        the precomputed indexes line up.
+        """
+        validated = validated_evalset("form_filling", name)
+
+        assert validated.case_ids
+        assert len(validated.cases_by_id) == len(validated.case_ids)
+        assert validated.tool_names_by_case.keys() == validated.cases_by_id.keys()
+
+    def test_evalset_tool_calls_valid(self, load_evalset):
+        """Test that every expected tool call names a known tool."""
         evalset = load_evalset("form_filling", "basic")
 
         for case in evalset["eval_cases"]:
-            assert "eval_case_id" in case
-            assert "conversation" in case
-            assert len(case["conversation"]) > 0
-            assert case["conversation"][0]["role"] == "user"
+            for tool_call in case.get("expected_tool_calls", []):
+                assert tool_call["tool_name"] in _KNOWN_TOOLS, (
+                    f"{case['eval_case_id']} references unknown tool "
+                    f"{tool_call['tool_name']}"
+                )
 
 
 @pytest.mark.evalset
+@pytest.mark.evalset_schema
 class TestFormFillingEvalCases:
     """Eval-based tests for form filling scenarios.
 
@@ -113,32 +443,144 @@ class TestFormFillingEvalCases:
     They are marked as evalset tests and can be run separately.
     """
 
-    def test_simple_form_complete_case_exists(self, load_evalset):
+    @pytest.mark.parametrize(
+        "case_id",
+        [
+            "simple_form_complete",
+            "simple_form_screenshot_verify",
+            "simple_form_partial",
+            "ref_workflow_validation",
+        ],
+    )
+    def test_case_present(self, case_id: str, case_ids):
+        """Every documented simple-form scenario has an eval case."""
+        assert case_id in case_ids("form_filling", "basic")
+
+    def test_simple_form_complete_case_exists(self, cases_by_id, tool_names_for):
         """Verify the simple form complete test case exists and is valid."""
-        evalset = load_evalset("form_filling", "basic")
+        cases = cases_by_id("form_filling", "basic")
 
-        case_ids = [c["eval_case_id"] for c in evalset["eval_cases"]]
-        assert "simple_form_complete" in case_ids
-
-        case = next(c for c in evalset["eval_cases"] if c["eval_case_id"] == "simple_form_complete")
+        assert "simple_form_complete" in cases
 
         # Verify expected tool calls
-        assert "expected_tool_calls" in case
-        tool_names = [tc["tool_name"] for tc in case["expected_tool_calls"]]
+        assert "expected_tool_calls" in cases["simple_form_complete"]
+        tool_names = tool_names_for("form_filling", "basic", "simple_form_complete")
         assert "browser_navigate" in tool_names
         assert "browser_type" in tool_names
 
-    def test_screenshot_verification_case(self, load_evalset):
+    def test_screenshot_verification_case(self, cases_by_id):
         """Verify screenshot verification test case."""
-        evalset = load_evalset("form_filling", "basic")
+        case = cases_by_id("form_filling", "basic").get("simple_form_screenshot_verify")
+
+        assert case is not None
+        assert "browser_screenshot" in [tc["tool_name"] for tc in case["expected_tool_calls"]]
+
 
-        case = next(
-            (c for c in evalset["eval_cases"] if c["eval_case_id"] == "simple_form_screenshot_verify"),
+# Validation-failure scenarios the complex evalset must cover.
+_COMPLEX_FAILURE_MODES = frozenset(
+    {
+        "complex_fail_missing_required",
+        "complex_fail_invalid_zip",
+    }
+)
+
+
+@pytest.mark.evalset
+@pytest.mark.evalset_schema
+class TestComplexFormEvalCases:
+    """Eval-based tests for the multi-step onboarding form scenarios."""
+
+    def test_failure_modes_exist(self, case_ids):
+        """Every documented validation-failure scenario has an eval case.
+
+        One set difference instead of a per-id membership loop: the
+        whole check is O(N+M) and a failure reports every missing case
+        at once.
+        """
+        missing = _COMPLEX_FAILURE_MODES - case_ids("form_filling", "complex")
+        assert not missing, f"Missing failure mode cases: {sorted(missing)}"
+
+    @pytest.mark.parametrize(
+        "case_id",
+        [
+            "complex_happy_full_onboarding",
+            "complex_happy_personal_info_only",
+        ],
+    )
+    def test_case_present(self, case_id: str, case_ids):
+        """Every documented onboarding happy path has an eval case."""
+        assert case_id in case_ids("form_filling", "complex")
+
+    def test_full_onboarding_case_exists(self, cases_by_id, tool_names_for):
+        """Verify the full onboarding case exists and spans the wizard."""
+        cases = cases_by_id("form_filling", "complex")
+
+        assert "complex_happy_full_onboarding" in cases
+
+        tool_names = tool_names_for("form_filling", "complex", "complex_happy_full_onboarding")
+        assert "browser_click" in tool_names
+        assert "browser_select_option" in tool_names
+
+    def test_full_onboarding_spans_all_steps(self, tool_names_for):
+        """The full trajectory re-snapshots per step and clicks through."""
+        tool_names = tool_names_for("form_filling", "complex", "complex_happy_full_onboarding")
+
+        # One Counter pass instead of an O(N) .count() scan per tool.
+        # One snapshot per wizard step; clicks cover step navigation,
+        # radio groups, and acknowledgements.
+        counts = Counter(tool_names)
+        assert counts["browser_snapshot"] >= 3
+        assert counts["browser_click"] >= 5
+
+    def test_date_format_uses_iso(self, cases_by_id):
+        """Date inputs only accept YYYY-MM-DD; typed dates must be ISO.
+
+        A single short-circuiting scan instead of building the list of
+        date-typed calls and then re-walking it: the generator stops at
+        the first offending call and allocates nothing when all pass.
+        """
+        case = cases_by_id("form_filling", "complex")["complex_happy_full_onboarding"]
+
+        bad = next(
+            (
+                tc
+                for tc in case["expected_tool_calls"]
+                if tc["tool_name"] == "browser_type"
+                and "arguments" in tc
+                and tc["arguments"].get("text", "")[:4].isdigit()
+                and "-" in tc["arguments"].get("text", "")
+                and not _ISO_DATE_RE.match(tc["arguments"]["text"])
+            ),
             None,
         )
+        assert bad is None, f"Expected ISO date, got: {bad['arguments']['text']}"
 
-        assert case is not None
-        assert "browser_screenshot" in [tc["tool_name"] for tc in case["expected_tool_calls"]]
+    def test_snapshot_before_interact_is_in_order(self, tool_names_for):
+        """A snapshot must precede the first typed or clicked element."""
+        tool_names = tool_names_for("form_filling", "complex", "complex_happy_full_onboarding")
+
+        first_snapshot = tool_names.index("browser_snapshot")
+        assert first_snapshot < tool_names.index("browser_type")
+        assert first_snapshot < tool_names.index("browser_click")
+
+    def test_step_navigation_enforces_click_before_step2(self, tool_names_for):
+        """Step-2 dropdowns are only reachable after a Next click."""
+        tool_names = tool_names_for("form_filling", "complex", "complex_happy_full_onboarding")
+
+        first_click = tool_names.index("browser_click")
+        last_select = _last_index(tool_names, "browser_select_option")
+        assert first_click < last_select, (
+            "Later-step selects must come after the step-advancing click"
+        )
+
+    def test_cross_step_refs_requires_resnapshot(self, tool_names_for):
+        """Refs go stale on step change, so navigation forces a re-snapshot."""
+        tool_names = tool_names_for("form_filling", "complex", "complex_happy_full_onboarding")
+
+        last_snapshot = _last_index(tool_names, "browser_snapshot")
+        assert last_snapshot > tool_names.index("browser_click"), (
+            "Expected a fresh snapshot after step navigation began"
+        )
 
 
 # =============================================================================
@@ -146,8 +588,6 @@ class TestFormFillingEvalCases:
 # =============================================================================
 
 
-@pytest.mark.integration
-@pytest.mark.slow
 class TestFormFillingIntegration:
     """Integration tests requiring mock server and Playwright MCP.
 
@@ -155,9 +595,20 @@ class TestFormFillingIntegration:
     - Mock server running on port 8080
     - Playwright MCP server running on port 3000
 
-    Run with: pytest -m integration
+    Run with: RUN_INTEGRATION=1 pytest -m integration
     """
 
+    # skipif at collection: without the opt-in the whole class skips
+    # before the mock_server_process fixture is ever materialized
+    pytestmark = [
+        pytest.mark.integration,
+        pytest.mark.slow,
+        pytest.mark.skipif(
+            not os.environ.get("RUN_INTEGRATION"),
+            reason="integration tests disabled (set RUN_INTEGRATION=1)",
+        ),
+    ]
+
     @pytest.fixture(autouse=True)
     def setup(self, mock_server_process, settings: "Settings"):
         """Ensure mock server is running before tests."""
@@ -172,7 +623,8 @@ class TestFormFillingIntegration:
             "Navigate to http://localhost:8080/simple and describe what you see"
         )
 
-        assert "contact" in result.lower() or "form" in result.lower()
+        lowered = result.lower()
+        assert "contact" in lowered or "form" in lowered
 
     @pytest.mark.skip(reason="Requires running Playwright MCP server")
     async def test_fill_simple_form(self, form_filling_data: dict[str, str]):
@@ -194,7 +646,8 @@ class TestFormFillingIntegration:
         result = await run_agent_task(task)
 
         # Verify agent reported filling the form
-        assert "filled" in result.lower() or "complete" in result.lower()
+        lowered = result.lower()
+        assert "filled" in lowered or "complete" in lowered
 
 
 # =============================================================================
@@ -203,9 +656,11 @@ class TestFormFillingIntegration:
 
 
 def evaluate_tool_trajectory(
-    actual_calls: list[dict[str, Any]],
-    expected_calls: list[dict[str, Any]],
+    actual_calls: Sequence[dict[str, Any]] | Sequence[str],
+    expected_calls: Sequence[dict[str, Any]] | Sequence[str],
     match_type: str = "IN_ORDER",
+    *,
+    names_precomputed: bool = False,
 ) -> float:
     """Evaluate tool call trajectory against expected calls.
 
@@ -213,6 +668,11 @@ def evaluate_tool_trajectory(
         actual_calls: List of actual tool calls made by the agent.
         expected_calls: List of expected tool calls from eval set.
         match_type: One of "EXACT", "IN_ORDER", or "ANY_ORDER".
+        names_precomputed: When True, both sequences already contain
+            tool names rather than call dicts. Batch evaluators that
+            score many trajectories against the same expected case can
+            pass cached name tuples and skip the per-call field
+            extraction on every invocation.
 
     Returns:
         Score between 0.0 and 1.0.
@@ -223,26 +683,45 @@ def evaluate_tool_trajectory(
     if not actual_calls:
         return 0.0
 
-    actual_names = [c.get("tool_name") for c in actual_calls]
-    expected_names = [c.get("tool_name") for c in expected_calls]
+    if names_precomputed:
+        # tuple() is a no-op for tuples; lists are copied once so every
+        # branch below compares like against like
+        _names = tuple
+    else:
+
+        def _names(calls: Sequence[dict[str, Any]]) -> tuple[str, ...]:
+            return tuple(c.get("tool_name") for c in calls)
 
     if match_type == "EXACT":
-        if actual_names == expected_names:
-            return 1.0
-        return 0.0
+        # A length mismatch can never score: bail before extracting names
+        if len(actual_calls) != len(expected_calls):
+            return 0.0
+        return 1.0 if _names(actual_calls) == _names(expected_calls) else 0.0
+
+    actual_names = _names(actual_calls)
+    expected_names = _names(expected_calls)
 
-    elif match_type == "IN_ORDER":
-        # Expected calls should appear in order within actual calls
+    if match_type == "IN_ORDER":
+        # Expected calls should appear in order within actual calls;
+        # stop scanning once every expected call has been seen
         expected_idx = 0
+        total = len(expected_names)
         for actual_name in actual_names:
-            if expected_idx < len(expected_names) and actual_name == expected_names[expected_idx]:
+            if actual_name == expected_names[expected_idx]:
                 expected_idx += 1
+                if expected_idx == total:
+                    break
 
-        return expected_idx / len(expected_names)
+        return expected_idx / total
 
     elif match_type == "ANY_ORDER":
-        # All expected calls should appear somewhere in actual calls
-        found = sum(1 for name in expected_names if name in actual_names)
+        # All expected calls should appear somewhere in actual calls.
+        # One set build makes each membership test O(1); the subset
+        # check resolves the common fully-matched case in one pass.
+        actual_set = set(actual_names)
+        if actual_set.issuperset(expected_names):
+            return 1.0
+        found = sum(1 for name in expected_names if name in actual_set)
         return found / len(expected_names)
 
     return 0.0
@@ -286,3 +765,12 @@ class TestTrajectoryEvaluation:
         expected = [{"tool_name": "a"}, {"tool_name": "b"}, {"tool_name": "c"}]
 
         assert evaluate_tool_trajectory(actual, expected, "ANY_ORDER") == 1.0
+
+    def test_precomputed_name_sequences(self, tool_names_for):
+        """Cached name tuples can be scored without re-extraction."""
+        names = tool_names_for("form_filling", "complex", "complex_happy_full_onboarding")
+
+        assert evaluate_tool_trajectory(names, names, "EXACT", names_precomputed=True) == 1.0
+        assert (
+            evaluate_tool_trajectory(names, names[:5], "IN_ORDER", names_precomputed=True) == 1.0
+        )
@@ -6,34 +6,53 @@ import os
 
 import pytest
 
+from gui_agent.config import Settings, get_settings
+
 
 class TestSettings:
     """Tests for Settings configuration."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_settings_cache(self):
+        """Keep the module-level get_settings() singleton isolated.
+
+        Tests below construct Settings() directly (no cache dance), but
+        anything going through get_settings() must not see an instance
+        cached by a previous test's environment.
+        """
+        get_settings.cache_clear()
+        yield
+        get_settings.cache_clear()
+
+    @pytest.fixture(autouse=True)
+    def _base_env(self, monkeypatch: pytest.MonkeyPatch):
+        """Start every test from a clean auth environment.
+
+        Clearing the auth variables once here lets each test set only
+        the deltas it cares about instead of repeating the delenv
+        preamble.
+        """
+        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+        monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+        monkeypatch.delenv("GOOGLE_GENAI_USE_VERTEXAI", raising=False)
+
     def test_api_key_auth_mode(self, monkeypatch: pytest.MonkeyPatch):
         """Test that API key is preferred when set."""
         monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
         monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "FALSE")
 
-        from gui_agent.config import get_settings
-
-        get_settings.cache_clear()
-        settings = get_settings()
+        settings = Settings()
 
         assert settings.auth_mode == "api_key"
         assert settings.google_api_key == "test-api-key"
 
     def test_vertex_ai_auth_mode(self, monkeypatch: pytest.MonkeyPatch):
         """Test Vertex AI auth mode when API key not set."""
-        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
         monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "TRUE")
         monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
         monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "us-central1")
 
-        from gui_agent.config import get_settings
-
-        get_settings.cache_clear()
-        settings = get_settings()
+        settings = Settings()
 
         assert settings.auth_mode == "vertex_ai"
         assert settings.google_cloud_project == "test-project"
@@ -41,42 +60,34 @@ class TestSettings:
 
     def test_vertex_ai_requires_project(self, monkeypatch: pytest.MonkeyPatch):
         """Test that Vertex AI mode requires a project ID."""
-        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
-        monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
         monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "TRUE")
         # Disable .env file loading for this test
         monkeypatch.setenv("PYDANTIC_SETTINGS_ENV_FILE", "")
 
-        from gui_agent.config import Settings, get_settings
-
-        get_settings.cache_clear()
-
         with pytest.raises(ValueError, match="GOOGLE_CLOUD_PROJECT must be set"):
             Settings(_env_file=None)
 
-    def test_default_values(self, monkeypatch: pytest.MonkeyPatch):
-        """Test default configuration values."""
-        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
-
-        from gui_agent.config import get_settings
+    def test_default_values(self):
+        """Test default configuration values.
 
-        get_settings.cache_clear()
-        settings = get_settings()
+        Reads the declared defaults straight off the model fields, so
+        no Settings instance (and no env/.env read) is built just to
+        check static declarations.
+        """
+        defaults = {name: field.default for name, field in Settings.model_fields.items()}
 
-        assert settings.model_name == "gemini-2.5-flash"
-        assert settings.playwright_mcp_url == "http://localhost:8931/sse"
-        assert settings.browser_headless is True
-        assert settings.phoenix_port == 6006
-        assert settings.max_agent_steps == 20
+        assert defaults["model_name"] == "gemini-2.5-flash"
+        assert defaults["playwright_mcp_url"] == "http://localhost:8931/sse"
+        assert defaults["browser_headless"] is True
+        assert defaults["phoenix_port"] == 6006
+        assert defaults["max_agent_steps"] == 20
+        assert defaults["max_parallel_tasks"] == 4
 
     def test_configure_environment_api_key(self, monkeypatch: pytest.MonkeyPatch):
         """Test environment configuration for API key mode."""
         monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
 
-        from gui_agent.config import get_settings
-
-        get_settings.cache_clear()
-        settings = get_settings()
+        settings = Settings()
         settings.configure_environment()
 
         assert os.environ.get("GOOGLE_API_KEY") == "test-api-key"
@@ -84,31 +95,37 @@ class TestSettings:
 
     def test_configure_environment_vertex_ai(self, monkeypatch: pytest.MonkeyPatch):
         """Test environment configuration for Vertex AI mode."""
-        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
         monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "TRUE")
         monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "my-project")
         monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "europe-west1")
 
-        from gui_agent.config import get_settings
-
-        get_settings.cache_clear()
-        settings = get_settings()
+        settings = Settings()
         settings.configure_environment()
 
         assert os.environ.get("GOOGLE_GENAI_USE_VERTEXAI") == "TRUE"
         assert os.environ.get("GOOGLE_CLOUD_PROJECT") == "my-project"
         assert os.environ.get("GOOGLE_CLOUD_LOCATION") == "europe-west1"
 
+    def test_configure_environment_runs_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that repeat calls skip the environment writes."""
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
+
+        settings = Settings()
+        settings.configure_environment()
+
+        # A second call must be a no-op, not re-apply the settings
+        monkeypatch.setenv("GOOGLE_API_KEY", "clobbered")
+        settings.configure_environment()
+
+        assert os.environ.get("GOOGLE_API_KEY") == "clobbered"
+
     def test_mock_server_url(self, monkeypatch: pytest.MonkeyPatch):
         """Test mock server URL property."""
         monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
         monkeypatch.setenv("MOCK_SERVER_HOST", "testhost")
         monkeypatch.setenv("MOCK_SERVER_PORT", "9999")
 
-        from gui_agent.config import get_settings
-
-        get_settings.cache_clear()
-        settings = get_settings()
+        settings = Settings()
 
         assert settings.mock_server_url == "http://testhost:9999"
 
@@ -118,9 +135,6 @@ class TestSettings:
         monkeypatch.setenv("PHOENIX_HOST", "phoenix.local")
         monkeypatch.setenv("PHOENIX_PORT", "7007")
 
-        from gui_agent.config import get_settings
-
-        get_settings.cache_clear()
-        settings = get_settings()
+        settings = Settings()
 
         assert settings.phoenix_ui_url == "http://phoenix.local:7007"
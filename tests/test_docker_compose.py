@@ -0,0 +1,141 @@
+"""Tests for the docker-compose service definitions.
+
+These validate the local development stack: Phoenix observability,
+the Playwright MCP server, and the mock form website.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+import yaml
+
+# libyaml's C parser when available; the pure-Python SafeLoader parses
+# the same files several times slower.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml is bundled in most wheels
+    from yaml import SafeLoader as _YamlLoader
+
+COMPOSE_PATH = Path(__file__).resolve().parent.parent / "docker-compose.yml"
+
+
+_COMPOSE_CACHE_KEY = "compose/docker-compose"
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and lists in tuples.
+
+    The parsed compose config is shared by every test in the session;
+    freezing it makes a stray mutation raise instead of silently
+    corrupting later tests, without paying for a defensive deepcopy.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+@pytest.fixture(scope="session")
+def compose_config(request: pytest.FixtureRequest) -> Mapping[str, Any]:
+    """Parsed docker-compose.yml, read and parsed once per session.
+
+    Tests only read the dict, so sharing one parse is safe. The parse
+    is also snapshotted into pytest's cache as JSON keyed by the file's
+    mtime and size, so repeat runs (watch mode, red/green loops) load
+    the cheaper JSON form and skip YAML parsing until the file changes.
+    """
+    file_stat = COMPOSE_PATH.stat()
+    key = [file_stat.st_mtime_ns, file_stat.st_size]
+    cached = request.config.cache.get(_COMPOSE_CACHE_KEY, None)
+    if cached is not None and cached["key"] == key:
+        return _freeze(cached["config"])
+
+    with open(COMPOSE_PATH) as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    request.config.cache.set(_COMPOSE_CACHE_KEY, {"key": key, "config": config})
+    return _freeze(config)
+
+
+@pytest.fixture(scope="session")
+def playwright_env(compose_config: Mapping[str, Any]) -> dict[str, str]:
+    """The playwright-mcp environment block as a dict.
+
+    Compose lists environment as KEY=VALUE strings; splitting once
+    turns every lookup below into an O(1) dict read instead of a
+    generator-plus-next() scan per test.
+    """
+    env = compose_config["services"]["playwright-mcp"]["environment"]
+    return dict(e.split("=", 1) for e in env)
+
+
+def test_compose_file_exists():
+    """The compose file ships at the repo root."""
+    assert COMPOSE_PATH.exists()
+
+
+def test_defines_expected_services(compose_config: Mapping[str, Any]):
+    """All three stack services are defined."""
+    services = compose_config["services"]
+
+    assert "phoenix" in services
+    assert "playwright-mcp" in services
+    assert "mock-server" in services
+
+
+def test_services_have_healthchecks(compose_config: Mapping[str, Any]):
+    """Every service declares a healthcheck."""
+    for name, service in compose_config["services"].items():
+        assert "healthcheck" in service, f"{name} has no healthcheck"
+
+
+def test_phoenix_exposes_otlp_ports(compose_config: Mapping[str, Any]):
+    """Phoenix publishes the UI plus both OTLP ports."""
+    ports = compose_config["services"]["phoenix"]["ports"]
+
+    assert "6006:6006" in ports
+    assert "4317:4317" in ports
+    assert "4318:4318" in ports
+
+
+def test_mock_server_behind_testing_profile(compose_config: Mapping[str, Any]):
+    """The mock server only starts with the testing profile."""
+    assert "testing" in compose_config["services"]["mock-server"]["profiles"]
+
+
+# Invariants of the playwright-mcp service block, applied by a single
+# parametrized test rather than one test method per substring check.
+_PLAYWRIGHT_MCP_INVARIANTS = [
+    ("mcp_port_published", lambda s: "8931:8931" in s["ports"]),
+    ("headless_by_default", lambda s: "--headless" in s["command"]),
+    ("mcp_port_flag", lambda s: "--port 8931" in s["command"]),
+    ("browser_cache_volume", lambda s: any("playwright_cache" in v for v in s["volumes"])),
+    ("waits_for_phoenix", lambda s: "phoenix" in s["depends_on"]),
+]
+
+
+@pytest.mark.parametrize(
+    ("name", "check"),
+    _PLAYWRIGHT_MCP_INVARIANTS,
+    ids=[name for name, _ in _PLAYWRIGHT_MCP_INVARIANTS],
+)
+def test_playwright_service_invariants(name: str, check, compose_config: Mapping[str, Any]):
+    """Each invariant holds for the playwright-mcp service block."""
+    service = compose_config["services"]["playwright-mcp"]
+
+    assert check(service), f"playwright-mcp invariant violated: {name}"
+
+
+def test_chromium_sandbox_flags_env(playwright_env: dict[str, str]):
+    """Chromium runs without the sandbox inside the container."""
+    assert "--no-sandbox" in playwright_env["PLAYWRIGHT_CHROMIUM_ARGS"]
+
+
+def test_display_env_set(playwright_env: dict[str, str]):
+    """A DISPLAY is configured for the containerized browser."""
+    assert "DISPLAY" in playwright_env
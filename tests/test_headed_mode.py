@@ -0,0 +1,151 @@
+"""Tests for headed/headless mode scripts and documentation.
+
+These validate that the run scripts, Makefile targets, and docs agree
+on how headed mode (visible browser for local dev) and headless mode
+(GCP Cloud Shell / CI) are started.
+"""
+
+from __future__ import annotations
+
+import stat
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_HEADED_SCRIPT = _REPO_ROOT / "scripts/run_headed.sh"
+
+# Files the headed/headless checks read; decoded once for the session.
+_CHECKED_FILES = (
+    "scripts/run_headed.sh",
+    "scripts/run_headless.sh",
+    "AGENTS.md",
+    "Makefile",
+    "docker-compose.yml",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FileEntry:
+    """Cached text and stat mode of one checked file."""
+
+    text: str
+    mode: int
+
+
+@pytest.fixture(scope="session")
+def repo_files() -> dict[str, FileEntry]:
+    """Text and mode of the headed-mode artifacts, read once per session.
+
+    ~15 tests poke at the same five files; one read and one stat each
+    instead of an open+read+decode (or extra stat) chain per test.
+    """
+    return {
+        name: FileEntry(path.read_text(), path.stat().st_mode)
+        for name in _CHECKED_FILES
+        for path in (_REPO_ROOT / name,)
+    }
+
+
+@pytest.fixture(scope="session")
+def repo_files_lower(repo_files: dict[str, FileEntry]) -> dict[str, str]:
+    """Lowercased view of repo_files, computed once per session.
+
+    Several tests do case-insensitive substring checks; str.lower()
+    copies the whole file each time, so the casefolded form is built
+    once alongside the raw text.
+    """
+    return {name: entry.text.lower() for name, entry in repo_files.items()}
+
+
+# Required content per startup script (checked case-insensitively):
+# the mode override plus the .env bootstrap both scripts must share.
+_SCRIPT_CHECKS = [
+    ("scripts/run_headed.sh", ("browser_headless=false", ".env.example")),
+    ("scripts/run_headless.sh", ("browser_headless=true", ".env.example")),
+]
+
+
+def _missing_needles(text: str, needles: tuple[str, ...]) -> list[str]:
+    """Return the needles absent from text.
+
+    Plain per-needle substring checks: an alternation-regex scan would
+    undercount overlapping needles (a run-headless match consumes the
+    headless inside it), and `in` over these cached KB-sized strings is
+    effectively free anyway.
+    """
+    return [needle for needle in needles if needle not in text]
+
+
+def test_headed_script_exists_and_executable(repo_files: dict[str, FileEntry]):
+    """The headed script ships and carries the executable bit."""
+    mode = repo_files["scripts/run_headed.sh"].mode
+
+    assert _HEADED_SCRIPT.exists()
+    assert mode & stat.S_IXUSR
+
+
+@pytest.mark.parametrize(("script", "needles"), _SCRIPT_CHECKS)
+def test_script_required_content(
+    script: str, needles: tuple[str, ...], repo_files_lower: dict[str, str]
+):
+    """Each startup script sets its mode and bootstraps .env.
+
+    One parametrized test over (script, needles) in place of a test
+    per script per substring; the checks run against the cached
+    lowercase text and a failure lists every missing needle for the
+    script.
+    """
+    content = repo_files_lower[script]
+
+    missing = _missing_needles(content, needles)
+    assert not missing, f"{script} is missing: {missing}"
+
+
+def test_run_headed_target(repo_files: dict[str, FileEntry]):
+    """make run-headed forces a visible browser."""
+    makefile = repo_files["Makefile"].text
+
+    assert "run-headed:" in makefile
+    assert "BROWSER_HEADLESS=false" in makefile
+
+
+def test_run_headless_target(repo_files: dict[str, FileEntry]):
+    """make run-headless forces headless mode."""
+    makefile = repo_files["Makefile"].text
+
+    assert "run-headless:" in makefile
+    assert "BROWSER_HEADLESS=true" in makefile
+
+
+# Everything AGENTS.md must mention: both make targets plus the
+# Cloud Shell no-display constraint.
+_AGENTS_NEEDLES = ("run-headed", "run-headless", "cloud shell", "headless")
+
+
+def test_agents_md_documents_modes_and_constraints(repo_files_lower: dict[str, str]):
+    """AGENTS.md covers both modes and the Cloud Shell limitation.
+
+    One test checks every required mention against the cached text; a
+    failure lists exactly which mentions are missing.
+    """
+    content = repo_files_lower["AGENTS.md"]
+
+    missing = _missing_needles(content, _AGENTS_NEEDLES)
+    assert not missing, f"AGENTS.md is missing: {missing}"
+
+
+def test_compose_defaults_to_headless(repo_files: dict[str, FileEntry]):
+    """The containerized MCP server runs headless by default."""
+    content = repo_files["docker-compose.yml"].text
+
+    assert "--headless" in content
+
+
+def test_compose_documents_headed_alternative(repo_files_lower: dict[str, str]):
+    """The compose file documents how to switch to headed mode."""
+    content = repo_files_lower["docker-compose.yml"]
+
+    assert "headed mode" in content
+    assert "x11" in content
@@ -0,0 +1,133 @@
+"""Tests for video recording management."""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from gui_agent.video import VideoManager
+
+
+@pytest.fixture
+def manager(tmp_path) -> VideoManager:
+    """A VideoManager rooted in a temporary recordings directory."""
+    settings = SimpleNamespace(
+        video_dir=str(tmp_path / "recordings"),
+        video_retention_days=7,
+    )
+    return VideoManager(settings)
+
+
+class TestVideoPaths:
+    """Tests for recording path generation."""
+
+    def test_path_embeds_session_and_timestamp(self, manager: VideoManager):
+        """Test that paths follow the session_<id>_<ts>.webm pattern."""
+        path = manager.get_video_path("abc123")
+
+        assert path.parent == manager.recordings_dir
+        assert path.name.startswith("session_abc123_")
+        assert path.suffix == ".webm"
+        # Timestamp portion: YYYYMMDD_HHMMSS
+        ts = path.stem.removeprefix("session_abc123_")
+        assert len(ts) == 15
+        assert ts[8] == "_"
+
+    def test_recordings_dir_created(self, manager: VideoManager):
+        """Test that the recordings directory exists after init."""
+        assert manager.recordings_dir.is_dir()
+
+
+class TestCleanup:
+    """Tests for retention-based cleanup."""
+
+    def test_old_recordings_deleted_recent_kept(self, manager: VideoManager):
+        """Test that only recordings past retention are removed."""
+        old = manager.recordings_dir / "session_old_20200101_000000.webm"
+        recent = manager.recordings_dir / "session_new_20990101_000000.webm"
+        old.write_bytes(b"old")
+        recent.write_bytes(b"new")
+        stale = time.time() - 30 * 86400
+        os.utime(old, (stale, stale))
+
+        deleted = manager.cleanup_old_recordings()
+
+        assert deleted == 1
+        assert not old.exists()
+        assert recent.exists()
+
+    def test_unrelated_files_untouched(self, manager: VideoManager):
+        """Test that non-recording files survive cleanup."""
+        other = manager.recordings_dir / "notes.txt"
+        other.write_text("keep me")
+        stale = time.time() - 30 * 86400
+        os.utime(other, (stale, stale))
+
+        assert manager.cleanup_old_recordings() == 0
+        assert other.exists()
+
+
+class TestStats:
+    """Tests for recording statistics."""
+
+    def test_empty_directory(self, manager: VideoManager):
+        """Test stats for a directory with no recordings."""
+        stats = manager.get_recording_stats()
+
+        assert stats == {
+            "count": 0,
+            "total_size_mb": 0.0,
+            "oldest": None,
+            "newest": None,
+        }
+
+    def test_counts_sizes_and_extremes(self, manager: VideoManager):
+        """Test that count, size, and oldest/newest are reported."""
+        first = manager.recordings_dir / "session_a_20240101_000000.webm"
+        second = manager.recordings_dir / "session_b_20240102_000000.webm"
+        first.write_bytes(b"x" * 1024)
+        second.write_bytes(b"y" * 2048)
+        earlier = time.time() - 3600
+        os.utime(first, (earlier, earlier))
+
+        stats = manager.get_recording_stats()
+
+        assert stats["count"] == 2
+        assert stats["total_size_mb"] == pytest.approx(3072 / (1024 * 1024))
+        assert stats["oldest"] == first.name
+        assert stats["newest"] == second.name
+
+
+class TestBatchConversion:
+    """Tests for batched mp4 conversion."""
+
+    def test_empty_batch(self, manager: VideoManager):
+        """Test that an empty batch is a no-op."""
+        assert manager.convert_many([]) == []
+
+    def test_single_file_delegates(self, manager: VideoManager, monkeypatch):
+        """Test that a one-file batch uses the single-file path."""
+        path = manager.recordings_dir / "session_a_20240101_000000.webm"
+        converted = path.with_suffix(".mp4")
+        monkeypatch.setattr(manager, "convert_to_mp4", lambda p: converted)
+
+        assert manager.convert_many([path]) == [converted]
+
+
+class TestDelete:
+    """Tests for single-recording deletion."""
+
+    def test_delete_existing(self, manager: VideoManager):
+        """Test that an existing recording is removed."""
+        path = manager.recordings_dir / "session_x_20240101_000000.webm"
+        path.write_bytes(b"data")
+
+        assert manager.delete_recording(path) is True
+        assert not path.exists()
+
+    def test_delete_missing_returns_false(self, manager: VideoManager):
+        """Test that deleting a missing file reports failure."""
+        path = manager.recordings_dir / "session_gone_20240101_000000.webm"
+
+        assert manager.delete_recording(path) is False